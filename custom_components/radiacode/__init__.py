@@ -1,12 +1,10 @@
 """The Radiacode integration for Home Assistant."""
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, Platform
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
@@ -31,17 +29,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         entry.data.get(CONF_BLUETOOTH_MAC),
         entry.data.get(CONF_SERIAL_NUMBER),
-        entry.data.get(CONF_NAME, "Radiacode"),
+        entry.data.get(CONF_NAME, entry.title),
+        entry.entry_id,
     )
 
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception as ex:
         _LOGGER.error("Failed to connect to Radiacode device: %s", ex)
+        # Setup is retried with a new coordinator, release this one's worker and device
+        await coordinator.async_shutdown()
         raise ConfigEntryNotReady from ex
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # A single coordinator listener fans every refresh out to the entities
+    entry.async_on_unload(coordinator.async_add_listener(coordinator.async_dispatch_update))
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
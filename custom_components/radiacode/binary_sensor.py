@@ -9,21 +9,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import (
-    CONF_BLUETOOTH_MAC,
-    CONF_SERIAL_NUMBER,
-    DOMAIN,
-    MANUFACTURER,
-    MODEL,
-    BINARY_SENSOR_ALARM_1,
-    BINARY_SENSOR_ALARM_2,
-    BINARY_SENSOR_DEVICE_ON,
-)
+from .const import DOMAIN
 from .coordinator import RadiacodeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +34,7 @@ async def async_setup_entry(
         RadiacodeDeviceOnBinarySensor(coordinator, config_entry),
     ]
 
+    # Keep this a single call: each call is a separate batch of registry and state writes
     async_add_entities(entities)
 
 
@@ -63,18 +55,26 @@ class RadiacodeBaseBinarySensor(BinarySensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self.config_entry.data[CONF_NAME],
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            serial_number=self.config_entry.data.get(CONF_SERIAL_NUMBER),
-        )
+        return self.coordinator.device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.connected
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator's update signal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state after a coordinator refresh."""
+        self.async_write_ha_state()
 
 
 class RadiacodeAlarm1BinarySensor(RadiacodeBaseBinarySensor):
@@ -86,21 +86,21 @@ class RadiacodeAlarm1BinarySensor(RadiacodeBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("alarms"):
+        if not self.coordinator.data or not self.coordinator.data.alarms:
             return False
-        return self.coordinator.data["alarms"]["alarm_1"]
+        return self.coordinator.data.alarms["alarm_1"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
+        if not self.coordinator.data or not self.coordinator.data.real_time_data:
             return {}
         
-        data = self.coordinator.data["real_time_data"]
+        data = self.coordinator.data.real_time_data
         return {
             "count_rate": data.get("count_rate"),
             "dose_rate": data.get("dose_rate"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
+            "timestamp": data.get("timestamp_iso"),
         }
 
 
@@ -113,21 +113,21 @@ class RadiacodeAlarm2BinarySensor(RadiacodeBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("alarms"):
+        if not self.coordinator.data or not self.coordinator.data.alarms:
             return False
-        return self.coordinator.data["alarms"]["alarm_2"]
+        return self.coordinator.data.alarms["alarm_2"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
+        if not self.coordinator.data or not self.coordinator.data.real_time_data:
             return {}
         
-        data = self.coordinator.data["real_time_data"]
+        data = self.coordinator.data.real_time_data
         return {
             "count_rate": data.get("count_rate"),
             "dose_rate": data.get("dose_rate"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
+            "timestamp": data.get("timestamp_iso"),
         }
 
 
@@ -140,17 +140,17 @@ class RadiacodeDeviceOnBinarySensor(RadiacodeBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
+        if not self.coordinator.data or not self.coordinator.data.device_status:
             return True  # Default to on if no data
-        return self.coordinator.data["device_status"]["device_on"]
+        return self.coordinator.data.device_status["device_on"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
+        if not self.coordinator.data or not self.coordinator.data.device_status:
             return {}
         
-        data = self.coordinator.data["device_status"]
+        data = self.coordinator.data.device_status
         return {
             "sound_on": data.get("sound_on"),
             "vibration_on": data.get("vibration_on"),
@@ -8,6 +8,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
@@ -16,6 +17,46 @@ from .const import CONF_BLUETOOTH_MAC, CONF_SERIAL_NUMBER, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_MAC_SEPARATOR_POSITIONS = (5, 8, 11, 14)
+_MAC_HEX_POSITIONS = (0, 1, 3, 4, 6, 7, 9, 10, 12, 13, 15, 16)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default="Radiacode"): str,
+    }
+)
+STEP_CONNECTION_TYPE_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("connection_type"): vol.In(
+            {"usb": "USB Connection", "bluetooth": "Bluetooth Connection"}
+        ),
+    }
+)
+STEP_BLUETOOTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BLUETOOTH_MAC): str,
+    }
+)
+STEP_USB_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SERIAL_NUMBER): str,
+    }
+)
+
+
+def _probe_device(bluetooth_mac: str | None, serial_number: str | None) -> str:
+    """Connect to a device and return its serial number in one blocking call.
+
+    The RadiaCode constructor already reads and checks the firmware version.
+    """
+    # Imported here so loading the integration does not pull in the USB/Bluetooth stacks
+    from radiacode import RadiaCode
+
+    device = RadiaCode(bluetooth_mac=bluetooth_mac, serial_number=serial_number)
+    return device.serial_number()
+
 
 class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Radiacode."""
@@ -29,14 +70,10 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(
                 step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required("name"): str,
-                    }
-                ),
+                data_schema=STEP_USER_DATA_SCHEMA,
             )
 
-        self._name = user_input["name"]
+        self._name = user_input[CONF_NAME]
         return await self.async_step_connection_type()
 
     async def async_step_connection_type(
@@ -46,11 +83,7 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(
                 step_id="connection_type",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required("connection_type"): vol.In(["usb", "bluetooth"]),
-                    }
-                ),
+                data_schema=STEP_CONNECTION_TYPE_DATA_SCHEMA,
             )
 
         connection_type = user_input["connection_type"]
@@ -74,13 +107,10 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 # Test connection
                 try:
-                    from radiacode import RadiaCode
-                    device = RadiaCode(bluetooth_mac=bluetooth_mac)
-                    device_info = {
-                        "serial_number": device.serial_number(),
-                        "fw_version": device.fw_version(),
-                    }
-                    
+                    await self.hass.async_add_executor_job(
+                        _probe_device, bluetooth_mac, None
+                    )
+
                     # Create unique ID based on MAC address
                     unique_id = f"radiacode_{bluetooth_mac.replace(':', '')}"
                     
@@ -103,11 +133,7 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="bluetooth",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BLUETOOTH_MAC): str,
-                }
-            ),
+            data_schema=STEP_BLUETOOTH_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -121,15 +147,12 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             serial_number = user_input.get(CONF_SERIAL_NUMBER)
             
             try:
-                from radiacode import RadiaCode
-                device = RadiaCode(serial_number=serial_number)
-                device_info = {
-                    "serial_number": device.serial_number(),
-                    "fw_version": device.fw_version(),
-                }
-                
+                device_serial = await self.hass.async_add_executor_job(
+                    _probe_device, None, serial_number
+                )
+
                 # Create unique ID based on serial number
-                unique_id = f"radiacode_{device.serial_number()}"
+                unique_id = f"radiacode_{device_serial}"
                 
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
@@ -147,18 +170,24 @@ class RadiacodeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="usb",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_SERIAL_NUMBER): str,
-                }
-            ),
+            data_schema=STEP_USB_DATA_SCHEMA,
             errors=errors,
         )
 
     def _is_valid_mac(self, mac: str) -> bool:
         """Validate MAC address format."""
-        mac_pattern = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
-        return bool(mac_pattern.match(mac))
+        # Fast path for the usual HH:HH:HH:HH:HH:HH / HH-HH-HH-HH-HH-HH layout
+        if len(mac) != 17:
+            return False
+        sep = mac[2]
+        if (
+            sep in ":-"
+            and all(mac[i] == sep for i in _MAC_SEPARATOR_POSITIONS)
+            and all(mac[i] in _HEX_DIGITS for i in _MAC_HEX_POSITIONS)
+        ):
+            return True
+        # Mixed separators are still accepted by the regex
+        return _MAC_RE.match(mac) is not None
 
     async def async_step_import(self, import_info: dict[str, Any]) -> FlowResult:
         """Handle import from configuration.yaml."""
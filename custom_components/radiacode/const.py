@@ -1,6 +1,41 @@
 """Constants for the Radiacode integration."""
 from typing import Final
 
+__all__ = [
+    "DOMAIN",
+    "CONF_BLUETOOTH_MAC",
+    "CONF_SERIAL_NUMBER",
+    "PLATFORMS",
+    "MANUFACTURER",
+    "MODEL",
+    "SENSOR_COUNT_RATE",
+    "SENSOR_DOSE_RATE",
+    "SENSOR_TEMPERATURE",
+    "SENSOR_BATTERY",
+    "SENSOR_ACCUMULATED_DOSE",
+    "SENSOR_SPECTRUM_DURATION",
+    "SENSOR_SPECTRUM_TOTAL_COUNTS",
+    "BINARY_SENSOR_ALARM_1",
+    "BINARY_SENSOR_ALARM_2",
+    "BINARY_SENSOR_DEVICE_ON",
+    "SWITCH_DEVICE_POWER",
+    "SWITCH_SOUND",
+    "SWITCH_VIBRATION",
+    "SWITCH_DISPLAY",
+    "UPDATE_INTERVAL",
+    "SPECTRUM_UPDATE_INTERVAL",
+    "BACKOFF_FACTOR",
+    "MAX_BACKOFF_INTERVAL",
+    "USB_MAX_FAILURES",
+    "SIGNAL_UPDATE",
+    "UNIT_COUNT_RATE",
+    "UNIT_DOSE_RATE",
+    "UNIT_DOSE",
+    "UNIT_TEMPERATURE",
+    "UNIT_BATTERY",
+    "UNIT_DURATION",
+]
+
 DOMAIN: Final = "radiacode"
 
 # Configuration keys
@@ -10,6 +45,9 @@ CONF_SERIAL_NUMBER: Final = "serial_number"
 # Platforms
 PLATFORMS: Final = ["sensor", "binary_sensor", "switch"]
 
+# Dispatcher signal sent after every refresh, suffixed with the config entry id
+SIGNAL_UPDATE: Final = f"{DOMAIN}_update"
+
 # Device info
 MANUFACTURER: Final = "Radiacode"
 MODEL: Final = "RadiaCode-10x"
@@ -38,6 +76,14 @@ SWITCH_DISPLAY: Final = "display"
 UPDATE_INTERVAL: Final = 10  # seconds
 SPECTRUM_UPDATE_INTERVAL: Final = 60  # seconds
 
+# Backoff on consecutive update failures
+BACKOFF_FACTOR: Final = 1.3
+MAX_BACKOFF_INTERVAL: Final = 300  # seconds
+
+# Failed USB commands in a row after which the library fails fast instead of waiting
+# for read timeouts, so a refresh of a detached device does not block for minutes
+USB_MAX_FAILURES: Final = 3
+
 # Units
 UNIT_COUNT_RATE: Final = "cps"  # counts per second
 UNIT_DOSE_RATE: Final = "μSv/h"  # microsieverts per hour
@@ -3,22 +3,88 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from homeassistant.core import HomeAssistant
+import numpy as np
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from radiacode import RadiaCode, RealTimeData, RareData, Spectrum
 
 from .const import (
+    BACKOFF_FACTOR,
+    DOMAIN,
+    MANUFACTURER,
+    MAX_BACKOFF_INTERVAL,
+    MODEL,
+    SIGNAL_UPDATE,
     UPDATE_INTERVAL,
     SPECTRUM_UPDATE_INTERVAL,
+    USB_MAX_FAILURES,
 )
 
+if TYPE_CHECKING:
+    from radiacode import RadiaCode, Spectrum
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+SPECTRUM_UPDATE_DELTA = timedelta(seconds=SPECTRUM_UPDATE_INTERVAL)
+
+# Seconds to collect device commands before running them as one batch
+COMMAND_BATCH_WINDOW = 0.01
+
+
+@dataclass(slots=True, frozen=True)
+class RadiacodeData:
+    """Device state read in one coordinator refresh."""
+
+    last_update: datetime
+    real_time_data: dict[str, Any] | None
+    rare_data: dict[str, Any] | None
+    spectrum: dict[str, Any] | None
+    alarms: dict[str, bool]
+    device_status: dict[str, bool]
+
+
+def _spectrum_to_dict(spectrum: Spectrum, now: datetime) -> dict[str, Any]:
+    """Convert a spectrum read from the device to coordinator data.
+
+    The counts are stored once as an int64 array, consumers get views of it.
+    The device sends u32 channel counts, int64 holds all of them.
+    """
+    counts = np.asarray(spectrum.counts, dtype=np.int64)
+    return {
+        "duration": spectrum.duration.total_seconds(),
+        "total_counts": int(np.add.reduce(counts)),
+        "channels": counts.size,
+        "calibration": {
+            "a0": spectrum.a0,
+            "a1": spectrum.a1,
+            "a2": spectrum.a2,
+        },
+        "counts": counts,
+        "timestamp": now,
+        "timestamp_iso": now.isoformat(),
+    }
+
 
-class RadiacodeCoordinator(DataUpdateCoordinator):
+def _supports_query(device: RadiaCode, query: str) -> bool:
+    """Return True if the device (and library version) answers a status query."""
+    try:
+        getattr(device, query)()
+    except Exception:
+        return False
+    return True
+
+
+class RadiacodeCoordinator(DataUpdateCoordinator[RadiacodeData]):
     """Coordinator for Radiacode device data."""
 
     def __init__(
@@ -27,6 +93,7 @@ class RadiacodeCoordinator(DataUpdateCoordinator):
         bluetooth_mac: str | None,
         serial_number: str | None,
         name: str,
+        entry_id: str,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -39,200 +106,379 @@ class RadiacodeCoordinator(DataUpdateCoordinator):
         self._bluetooth_mac = bluetooth_mac
         self._serial_number = serial_number
         self._device: RadiaCode | None = None
+        # (RealTimeData, RareData), set once the library is imported on connect
+        self._record_types: tuple[type, type] | None = None
+        self._has_sound: bool | None = None
+        self._has_vibro: bool | None = None
         self._last_spectrum_update = datetime.now()
-        self._spectrum_data: dict[str, Any] = {}
+        self._spectrum_data: dict[str, Any] | None = None
+        self._device_identity: dict[str, Any] | None = None
+        self._fail_count = 0
+        self._spectrum_consumers = 0
+        # Shared between snapshots while unchanged, replaced rather than mutated
+        self._alarms = {
+            "alarm_1": False,
+            "alarm_2": False,
+        }
+        self._device_status = {
+            "device_on": True,
+            "sound_on": False,
+            "vibration_on": False,
+            "display_on": True,
+        }
+        # The device is a single USB/Bluetooth endpoint: all device I/O runs on this one
+        # worker, which serializes it. Device I/O can also block for seconds on a stalled
+        # device, so it queues up here instead of tying up threads of the shared executor.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="radiacode")
+        # Read by every entity's available property, updated once per refresh
+        self.connected = False
+        # Device commands waiting for the next batch, see _async_run_command
+        self._pending_commands: list[tuple[Callable[[], Any], asyncio.Future[None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Entities subscribe to this instead of each adding a coordinator listener
+        self.update_signal = f"{SIGNAL_UPDATE}_{entry_id}"
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=name,
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+            serial_number=serial_number,
+        )
         
+    def _connect_sync(self) -> None:
+        """Open the device and read its identity, runs in the executor."""
+        # Imported here so loading the integration does not pull in the USB/Bluetooth stacks
+        from radiacode import RadiaCode, RareData, RealTimeData
+
+        self._record_types = (RealTimeData, RareData)
+        if self._bluetooth_mac:
+            _LOGGER.info("Connecting to Radiacode device via Bluetooth: %s", self._bluetooth_mac)
+            device = RadiaCode(bluetooth_mac=self._bluetooth_mac)
+        else:
+            _LOGGER.info("Connecting to Radiacode device via USB")
+            device = RadiaCode(serial_number=self._serial_number, usb_cb_max_failures=USB_MAX_FAILURES)
+
+        # Device identity never changes, only query it on the first connect
+        if self._device_identity is None:
+            self._device_identity = {
+                "serial_number": device.serial_number(),
+                "firmware_version": device.fw_version(),
+                "hardware_serial": device.hw_serial_number(),
+            }
+        _LOGGER.info("Connected to Radiacode device: %s", self._device_identity)
+
+        # Probe the optional status queries once instead of failing on every refresh
+        if self._has_sound is None:
+            self._has_sound = _supports_query(device, "get_sound_on")
+            self._has_vibro = _supports_query(device, "get_vibro_on")
+
+        self._device = device
+
+    def _async_device_job(self, func: Callable[..., _T], *args: Any) -> asyncio.Future[_T]:
+        """Run a blocking device call on the coordinator's own worker thread.
+
+        Every device call goes through here, the single worker runs them one at a time.
+        """
+        return self.hass.loop.run_in_executor(self._executor, func, *args)
+
     async def async_connect(self) -> None:
         """Connect to the Radiacode device."""
         try:
-            if self._bluetooth_mac:
-                _LOGGER.info("Connecting to Radiacode device via Bluetooth: %s", self._bluetooth_mac)
-                self._device = RadiaCode(bluetooth_mac=self._bluetooth_mac)
-            else:
-                _LOGGER.info("Connecting to Radiacode device via USB")
-                self._device = RadiaCode(serial_number=self._serial_number)
-                
-            # Test connection by getting device info
-            device_info = {
-                "serial_number": self._device.serial_number(),
-                "firmware_version": self._device.fw_version(),
-                "hardware_serial": self._device.hw_serial_number(),
-            }
-            _LOGGER.info("Connected to Radiacode device: %s", device_info)
-            
+            await self._async_device_job(self._connect_sync)
         except Exception as ex:
             _LOGGER.error("Failed to connect to Radiacode device: %s", ex)
             raise
 
+    @callback
+    def async_add_spectrum_consumer(self) -> CALLBACK_TYPE:
+        """Request spectrum reads on refresh, return a callback to release it."""
+        self._spectrum_consumers += 1
+
+        @callback
+        def remove_consumer() -> None:
+            self._spectrum_consumers -= 1
+
+        return remove_consumer
+
+    @callback
+    def async_dispatch_update(self) -> None:
+        """Tell all entities of this device about new data with a single signal."""
+        async_dispatcher_send(self.hass, self.update_signal)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this device."""
+        return self._device_info
+
+    @property
+    def device_identity(self) -> dict[str, Any] | None:
+        """Return the cached serial numbers and firmware version."""
+        return self._device_identity
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        await super().async_shutdown()
         if self._device:
             # Note: RadiaCode library doesn't have explicit disconnect method
             self._device = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, future in self._pending_commands:
+            future.cancel()
+        self._pending_commands = []
+        self._executor.shutdown(wait=False)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data from the Radiacode device."""
-        if not self._device:
-            await self.async_connect()
-            
-        try:
-            data: dict[str, Any] = {
-                "last_update": datetime.now(),
-                "real_time_data": None,
-                "rare_data": None,
-                "alarms": {
-                    "alarm_1": False,
-                    "alarm_2": False,
-                },
-                "device_status": {
-                    "device_on": True,
-                    "sound_on": False,
-                    "vibration_on": False,
-                    "display_on": True,
-                },
-            }
-            
-            # Get real-time data
-            databuf = self._device.data_buf()
-            latest_real_time = None
-            latest_rare = None
-            
-            for record in databuf:
-                if isinstance(record, RealTimeData):
+    def _read_device(self) -> RadiacodeData:
+        """Read all data for one refresh from the device.
+
+        Runs on the device worker, so every device call of a refresh shares a
+        single round-trip between the event loop and the worker thread.
+        Do not split this into several executor jobs.
+        """
+        # One clock read per refresh, shared by all timestamps below
+        now = datetime.now()
+        real_time_data = None
+        rare_data = None
+
+        # Get real-time data, newest records are at the end of the buffer
+        latest_real_time = None
+        latest_rare = None
+        real_time_type, rare_type = self._record_types
+        for record in reversed(self._device.data_buf()):
+            record_type = type(record)
+            if record_type is real_time_type:
+                if latest_real_time is None:
                     latest_real_time = record
-                elif isinstance(record, RareData):
+            elif record_type is rare_type:
+                if latest_rare is None:
                     latest_rare = record
-                    
-            if latest_real_time:
-                data["real_time_data"] = {
-                    "count_rate": latest_real_time.count_rate,
-                    "count_rate_error": latest_real_time.count_rate_err,
-                    "dose_rate": latest_real_time.dose_rate,
-                    "dose_rate_error": latest_real_time.dose_rate_err,
-                    "timestamp": latest_real_time.dt,
-                    "flags": latest_real_time.flags,
-                }
-                
-            if latest_rare:
-                data["rare_data"] = {
-                    "duration": latest_rare.duration,
-                    "dose": latest_rare.dose,
-                    "temperature": latest_rare.temperature,
-                    "charge_level": latest_rare.charge_level,
-                    "flags": latest_rare.flags,
-                }
-                
-            # Update spectrum data periodically
-            now = datetime.now()
-            if (now - self._last_spectrum_update).total_seconds() >= SPECTRUM_UPDATE_INTERVAL:
-                try:
-                    spectrum = self._device.spectrum()
-                    data["spectrum"] = {
-                        "duration": spectrum.duration.total_seconds(),
-                        "total_counts": sum(spectrum.counts),
-                        "calibration": {
-                            "a0": spectrum.a0,
-                            "a1": spectrum.a1,
-                            "a2": spectrum.a2,
-                        },
-                        "counts": spectrum.counts,
-                        "timestamp": now,
-                    }
-                    self._last_spectrum_update = now
-                except Exception as ex:
-                    _LOGGER.warning("Failed to update spectrum data: %s", ex)
-                    
-            # Get device configuration
+            if latest_real_time is not None and latest_rare is not None:
+                break
+
+        if latest_real_time:
+            real_time_data = {
+                "count_rate": latest_real_time.count_rate,
+                "count_rate_error": latest_real_time.count_rate_err,
+                "dose_rate": latest_real_time.dose_rate,
+                "dose_rate_error": latest_real_time.dose_rate_err,
+                "timestamp": latest_real_time.dt,
+                "timestamp_iso": latest_real_time.dt.isoformat(),
+                "flags": latest_real_time.flags,
+            }
+
+        if latest_rare:
+            rare_data = {
+                "duration": latest_rare.duration,
+                "dose": latest_rare.dose,
+                "temperature": latest_rare.temperature,
+                "charge_level": latest_rare.charge_level,
+                "flags": latest_rare.flags,
+                "timestamp": latest_rare.dt,
+                "timestamp_iso": latest_rare.dt.isoformat(),
+            }
+
+        # Update spectrum data periodically, keep the last one in between.
+        # The spectrum is the largest transfer, skip it while nothing uses it.
+        if self._spectrum_consumers and now - self._last_spectrum_update >= SPECTRUM_UPDATE_DELTA:
             try:
-                # These might fail if device doesn't support them
-                data["device_status"]["sound_on"] = self._device.get_sound_on()
-                data["device_status"]["vibration_on"] = self._device.get_vibro_on()
-            except:
-                pass  # Not all devices support these queries
-                
-            return data
-            
+                self._spectrum_data = _spectrum_to_dict(self._device.spectrum(), now)
+                self._last_spectrum_update = now
+            except Exception as ex:
+                _LOGGER.warning("Failed to update spectrum data: %s", ex)
+
+        # Get device configuration, the status dict is only replaced when it changes.
+        # Not all devices support these queries, see the probe in async_connect.
+        device_status = self._device_status
+        sound_on = self._device.get_sound_on() if self._has_sound else device_status["sound_on"]
+        vibration_on = self._device.get_vibro_on() if self._has_vibro else device_status["vibration_on"]
+        if sound_on != device_status["sound_on"] or vibration_on != device_status["vibration_on"]:
+            self._device_status = {
+                **device_status,
+                "sound_on": sound_on,
+                "vibration_on": vibration_on,
+            }
+
+        return RadiacodeData(
+            last_update=now,
+            real_time_data=real_time_data,
+            rare_data=rare_data,
+            spectrum=self._spectrum_data,
+            alarms=self._alarms,
+            device_status=self._device_status,
+        )
+
+    async def _async_update_data(self) -> RadiacodeData:
+        """Update data from the Radiacode device."""
+        try:
+            if not self._device:
+                await self.async_connect()
+            data = await self._async_device_job(self._read_device)
         except Exception as ex:
+            # Poll an unreachable device less often, up to MAX_BACKOFF_INTERVAL
+            self.connected = False
+            self._fail_count += 1
+            self.update_interval = timedelta(
+                seconds=min(
+                    MAX_BACKOFF_INTERVAL,
+                    UPDATE_INTERVAL * BACKOFF_FACTOR**self._fail_count,
+                )
+            )
             _LOGGER.error("Error updating Radiacode data: %s", ex)
             raise UpdateFailed(f"Error updating Radiacode data: {ex}") from ex
 
+        self._async_poll_succeeded()
+        return data
+
+    @callback
+    def _async_poll_succeeded(self) -> None:
+        """Mark the device reachable and end any backoff after a successful read."""
+        self.connected = True
+        if self._fail_count:
+            self._fail_count = 0
+            self.update_interval = timedelta(seconds=UPDATE_INTERVAL)
+
+    def _run_batch_and_poll_sync(
+        self, commands: list[Callable[[], Any]]
+    ) -> tuple[list[Exception | None], RadiacodeData | None]:
+        """Run queued device commands and read fresh data once, in one executor job.
+
+        A failing command does not stop the others, its error is returned in
+        the position of the command. The data is None if the read after the
+        commands failed, the commands' own results are unaffected by that.
+        """
+        errors: list[Exception | None] = []
+        for command in commands:
+            try:
+                command()
+            except Exception as ex:  # noqa: BLE001 - handed back to the caller
+                errors.append(ex)
+            else:
+                errors.append(None)
+        try:
+            data = self._read_device()
+        except Exception as ex:  # noqa: BLE001 - left to the regular refresh
+            _LOGGER.debug("Reading data after device commands failed: %s", ex)
+            data = None
+        return errors, data
+
+    async def _async_run_command(self, command: Callable[[], Any]) -> None:
+        """Run a device command and publish the data read after it.
+
+        Commands issued within COMMAND_BATCH_WINDOW of each other are run
+        together in one executor job, followed by a single data read.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_commands.append((command, future))
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                COMMAND_BATCH_WINDOW, self._async_flush_commands
+            )
+        await future
+
+    @callback
+    def _async_flush_commands(self) -> None:
+        """Hand the commands queued so far to the device worker as one batch."""
+        self._flush_handle = None
+        batch, self._pending_commands = self._pending_commands, []
+        self.hass.async_create_task(self._async_run_batch(batch))
+
+    async def _async_run_batch(
+        self, batch: list[tuple[Callable[[], Any], asyncio.Future[None]]]
+    ) -> None:
+        """Run a batch of commands, resolve each command's future and publish the data."""
+        try:
+            errors, data = await self._async_device_job(
+                self._run_batch_and_poll_sync, [command for command, _ in batch]
+            )
+        except Exception as ex:  # noqa: BLE001 - the batch never ran, fail every caller
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for (_, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+        if data is None:
+            # Let a regular refresh retry the read, it marks the device unavailable
+            # and backs off the same way as a failed poll
+            await self.async_request_refresh()
+            return
+        self._async_poll_succeeded()
+        self.async_set_updated_data(data)
+
     async def async_set_device_power(self, power_on: bool) -> None:
         """Set device power state."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.set_device_on(power_on)
-        await self.async_request_refresh()
+
+        await self._async_run_command(partial(self._device.set_device_on, power_on))
 
     async def async_set_sound(self, sound_on: bool) -> None:
         """Set device sound state."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.set_sound_on(sound_on)
-        await self.async_request_refresh()
+
+        await self._async_run_command(partial(self._device.set_sound_on, sound_on))
 
     async def async_set_vibration(self, vibration_on: bool) -> None:
         """Set device vibration state."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.set_vibro_on(vibration_on)
-        await self.async_request_refresh()
+
+        await self._async_run_command(partial(self._device.set_vibro_on, vibration_on))
 
     async def async_set_display_brightness(self, brightness: int) -> None:
         """Set display brightness (0-9)."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.set_display_brightness(brightness)
-        await self.async_request_refresh()
+
+        await self._async_run_command(
+            partial(self._device.set_display_brightness, brightness)
+        )
 
     async def async_reset_dose(self) -> None:
         """Reset accumulated dose."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.dose_reset()
-        await self.async_request_refresh()
+
+        await self._async_run_command(self._device.dose_reset)
 
     async def async_reset_spectrum(self) -> None:
         """Reset spectrum data."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.spectrum_reset()
-        await self.async_request_refresh()
+
+        # Read the cleared spectrum right away instead of at the next interval
+        self._last_spectrum_update = datetime.min
+        await self._async_run_command(self._device.spectrum_reset)
 
     async def async_get_spectrum(self) -> dict[str, Any]:
         """Get current spectrum data."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        spectrum = self._device.spectrum()
-        return {
-            "duration": spectrum.duration.total_seconds(),
-            "total_counts": sum(spectrum.counts),
-            "calibration": {
-                "a0": spectrum.a0,
-                "a1": spectrum.a1,
-                "a2": spectrum.a2,
-            },
-            "counts": spectrum.counts,
-            "timestamp": datetime.now(),
-        }
+
+        spectrum = await self._async_device_job(self._device.spectrum)
+        return _spectrum_to_dict(spectrum, datetime.now())
 
     async def async_get_energy_calibration(self) -> list[float]:
         """Get energy calibration coefficients."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        return self._device.energy_calib()
+
+        return await self._async_device_job(self._device.energy_calib)
 
     async def async_set_energy_calibration(self, coefficients: list[float]) -> None:
         """Set energy calibration coefficients."""
         if not self._device:
             raise RuntimeError("Device not connected")
-            
-        self._device.set_energy_calib(coefficients)
-        await self.async_request_refresh()
\ No newline at end of file
+
+        await self._async_run_command(
+            partial(self._device.set_energy_calib, coefficients)
+        )
@@ -11,32 +11,20 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_NAME,
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import (
-    CONF_BLUETOOTH_MAC,
-    CONF_SERIAL_NUMBER,
     DOMAIN,
-    MANUFACTURER,
-    MODEL,
-    SENSOR_ACCUMULATED_DOSE,
-    SENSOR_BATTERY,
-    SENSOR_COUNT_RATE,
-    SENSOR_DOSE_RATE,
-    SENSOR_SPECTRUM_DURATION,
-    SENSOR_SPECTRUM_TOTAL_COUNTS,
-    SENSOR_TEMPERATURE,
     UNIT_COUNT_RATE,
     UNIT_DOSE,
     UNIT_DOSE_RATE,
-    UNIT_DURATION,
 )
 from .coordinator import RadiacodeCoordinator
 
@@ -61,12 +49,21 @@ async def async_setup_entry(
         RadiacodeSpectrumTotalCountsSensor(coordinator, config_entry),
     ]
 
+    # Keep this a single call: each call is a separate batch of registry and state writes
     async_add_entities(entities)
 
 
 class RadiacodeBaseSensor(SensorEntity):
     """Base class for Radiacode sensors."""
 
+    # RadiacodeData field holding this sensor's data, and the key of its value in there
+    _section_key: str
+    _value_key: str
+    # Snapshot of that field, taken once per coordinator update rather than on every property read
+    _section: dict[str, Any] | None = None
+    # (attribute name, data key) pairs exposed as state attributes, None for no attributes
+    _attr_keys: tuple[tuple[str, str], ...] | None = None
+
     def __init__(
         self,
         coordinator: RadiacodeCoordinator,
@@ -81,46 +78,68 @@ class RadiacodeBaseSensor(SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self.config_entry.data[CONF_NAME],
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            serial_number=self.config_entry.data.get(CONF_SERIAL_NUMBER),
-        )
+        return self.coordinator.device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.connected
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator's update signal."""
+        await super().async_added_to_hass()
+        self._update_section()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+            )
+        )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state after a coordinator refresh."""
+        self._update_section()
+        self.async_write_ha_state()
 
-class RadiacodeCountRateSensor(RadiacodeBaseSensor):
-    """Representation of a Radiacode count rate sensor."""
+    def _update_section(self) -> None:
+        """Snapshot this sensor's section of the latest coordinator data."""
+        data = self.coordinator.data
+        self._section = getattr(data, self._section_key) if data else None
 
-    _attr_name = "Count Rate"
-    _attr_native_unit_of_measurement = UNIT_COUNT_RATE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_device_class = SensorDeviceClass.FREQUENCY
+    def _attrs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the state attributes from this sensor's section."""
+        attrs = {name: data.get(key) for name, key in self._attr_keys}
+        # Formatted once per update by the coordinator, shared by every sensor of the section
+        attrs["timestamp"] = data.get("timestamp_iso")
+        return attrs
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
+        if not self._section:
             return None
-        return self.coordinator.data["real_time_data"]["count_rate"]
+        return self._section[self._value_key]
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
+        if self._attr_keys is None:
+            return None
+        if not self._section:
             return {}
-        
-        data = self.coordinator.data["real_time_data"]
-        return {
-            "count_rate_error": data.get("count_rate_error"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
+        return self._attrs(self._section)
+
+
+class RadiacodeCountRateSensor(RadiacodeBaseSensor):
+    """Representation of a Radiacode count rate sensor."""
+
+    _attr_name = "Count Rate"
+    _attr_native_unit_of_measurement = UNIT_COUNT_RATE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.FREQUENCY
+    _section_key = "real_time_data"
+    _value_key = "count_rate"
+    _attr_keys = (("count_rate_error", "count_rate_error"),)
 
 
 class RadiacodeDoseRateSensor(RadiacodeBaseSensor):
@@ -129,25 +148,9 @@ class RadiacodeDoseRateSensor(RadiacodeBaseSensor):
     _attr_name = "Dose Rate"
     _attr_native_unit_of_measurement = UNIT_DOSE_RATE
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
-            return None
-        return self.coordinator.data["real_time_data"]["dose_rate"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("real_time_data"):
-            return {}
-        
-        data = self.coordinator.data["real_time_data"]
-        return {
-            "dose_rate_error": data.get("dose_rate_error"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
+    _section_key = "real_time_data"
+    _value_key = "dose_rate"
+    _attr_keys = (("dose_rate_error", "dose_rate_error"),)
 
 
 class RadiacodeTemperatureSensor(RadiacodeBaseSensor):
@@ -157,25 +160,9 @@ class RadiacodeTemperatureSensor(RadiacodeBaseSensor):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_device_class = SensorDeviceClass.TEMPERATURE
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("rare_data"):
-            return None
-        return self.coordinator.data["rare_data"]["temperature"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("rare_data"):
-            return {}
-        
-        data = self.coordinator.data["rare_data"]
-        return {
-            "duration": data.get("duration"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
+    _section_key = "rare_data"
+    _value_key = "temperature"
+    _attr_keys = (("duration", "duration"),)
 
 
 class RadiacodeBatterySensor(RadiacodeBaseSensor):
@@ -185,13 +172,8 @@ class RadiacodeBatterySensor(RadiacodeBaseSensor):
     _attr_native_unit_of_measurement = "%"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_device_class = SensorDeviceClass.BATTERY
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("rare_data"):
-            return None
-        return self.coordinator.data["rare_data"]["charge_level"]
+    _section_key = "rare_data"
+    _value_key = "charge_level"
 
 
 class RadiacodeAccumulatedDoseSensor(RadiacodeBaseSensor):
@@ -200,82 +182,47 @@ class RadiacodeAccumulatedDoseSensor(RadiacodeBaseSensor):
     _attr_name = "Accumulated Dose"
     _attr_native_unit_of_measurement = UNIT_DOSE
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _section_key = "rare_data"
+    _value_key = "dose"
+    _attr_keys = (("duration", "duration"),)
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("rare_data"):
-            return None
-        return self.coordinator.data["rare_data"]["dose"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("rare_data"):
-            return {}
-        
-        data = self.coordinator.data["rare_data"]
-        return {
-            "duration": data.get("duration"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
+class RadiacodeSpectrumBaseSensor(RadiacodeBaseSensor):
+    """Base class for sensors that need the spectrum to be read."""
+
+    _section_key = "spectrum"
+
+    async def async_added_to_hass(self) -> None:
+        """Register as a spectrum consumer when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_spectrum_consumer())
 
+    def _attrs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the state attributes, including the energy calibration."""
+        attrs = {name: data.get(key) for name, key in self._attr_keys}
+        calibration = data.get("calibration", {})
+        attrs["calibration_a0"] = calibration.get("a0")
+        attrs["calibration_a1"] = calibration.get("a1")
+        attrs["calibration_a2"] = calibration.get("a2")
+        attrs["timestamp"] = data.get("timestamp_iso")
+        return attrs
 
-class RadiacodeSpectrumDurationSensor(RadiacodeBaseSensor):
+
+class RadiacodeSpectrumDurationSensor(RadiacodeSpectrumBaseSensor):
     """Representation of a Radiacode spectrum duration sensor."""
 
     _attr_name = "Spectrum Duration"
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _value_key = "duration"
+    _attr_keys = (("total_counts", "total_counts"),)
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("spectrum"):
-            return None
-        return self.coordinator.data["spectrum"]["duration"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("spectrum"):
-            return {}
-        
-        data = self.coordinator.data["spectrum"]
-        return {
-            "total_counts": data.get("total_counts"),
-            "calibration_a0": data.get("calibration", {}).get("a0"),
-            "calibration_a1": data.get("calibration", {}).get("a1"),
-            "calibration_a2": data.get("calibration", {}).get("a2"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
-
-
-class RadiacodeSpectrumTotalCountsSensor(RadiacodeBaseSensor):
+class RadiacodeSpectrumTotalCountsSensor(RadiacodeSpectrumBaseSensor):
     """Representation of a Radiacode spectrum total counts sensor."""
 
     _attr_name = "Spectrum Total Counts"
     _attr_native_unit_of_measurement = "counts"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or not self.coordinator.data.get("spectrum"):
-            return None
-        return self.coordinator.data["spectrum"]["total_counts"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("spectrum"):
-            return {}
-        
-        data = self.coordinator.data["spectrum"]
-        return {
-            "duration": data.get("duration"),
-            "calibration_a0": data.get("calibration", {}).get("a0"),
-            "calibration_a1": data.get("calibration", {}).get("a1"),
-            "calibration_a2": data.get("calibration", {}).get("a2"),
-            "timestamp": data.get("timestamp").isoformat() if data.get("timestamp") else None,
-        }
\ No newline at end of file
+    _value_key = "total_counts"
+    _attr_keys = (("duration", "duration"),)
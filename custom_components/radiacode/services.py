@@ -1,17 +1,31 @@
 """Services for the Radiacode integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
 from .const import DOMAIN
 
+if TYPE_CHECKING:
+    from .coordinator import RadiacodeCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 SERVICE_RESET_DOSE = "reset_dose"
 SERVICE_RESET_SPECTRUM = "reset_spectrum"
 SERVICE_SET_DISPLAY_BRIGHTNESS = "set_display_brightness"
@@ -19,143 +33,226 @@ SERVICE_GET_SPECTRUM = "get_spectrum"
 SERVICE_GET_ENERGY_CALIBRATION = "get_energy_calibration"
 SERVICE_SET_ENERGY_CALIBRATION = "set_energy_calibration"
 
-SERVICE_SCHEMA_RESET_DOSE = vol.Schema({})
-SERVICE_SCHEMA_RESET_SPECTRUM = vol.Schema({})
+# Every service registered by async_setup_services, removed again on unload
+SERVICES = (
+    SERVICE_RESET_DOSE,
+    SERVICE_RESET_SPECTRUM,
+    SERVICE_SET_DISPLAY_BRIGHTNESS,
+    SERVICE_GET_SPECTRUM,
+    SERVICE_GET_ENERGY_CALIBRATION,
+    SERVICE_SET_ENERGY_CALIBRATION,
+)
+
+# Validators built once and shared by every schema field that needs them
+_BRIGHTNESS = vol.All(vol.Coerce(int), vol.Range(min=0, max=9))
+_FLOAT = vol.Coerce(float)
+
+# Services without fields share one empty schema
+_EMPTY_SCHEMA = vol.Schema({})
+
+SERVICE_SCHEMA_RESET_DOSE = _EMPTY_SCHEMA
+SERVICE_SCHEMA_RESET_SPECTRUM = _EMPTY_SCHEMA
 SERVICE_SCHEMA_SET_DISPLAY_BRIGHTNESS = vol.Schema(
     {
-        vol.Required("brightness"): vol.All(vol.Coerce(int), vol.Range(min=0, max=9))
+        vol.Required("brightness"): _BRIGHTNESS,
     }
 )
-SERVICE_SCHEMA_GET_SPECTRUM = vol.Schema({})
-SERVICE_SCHEMA_GET_ENERGY_CALIBRATION = vol.Schema({})
+SERVICE_SCHEMA_GET_SPECTRUM = _EMPTY_SCHEMA
+SERVICE_SCHEMA_GET_ENERGY_CALIBRATION = _EMPTY_SCHEMA
 SERVICE_SCHEMA_SET_ENERGY_CALIBRATION = vol.Schema(
     {
-        vol.Required("a0"): vol.Coerce(float),
-        vol.Required("a1"): vol.Coerce(float),
-        vol.Required("a2"): vol.Coerce(float),
+        vol.Required("a0"): _FLOAT,
+        vol.Required("a1"): _FLOAT,
+        vol.Required("a2"): _FLOAT,
     }
 )
 
 
+async def _async_call_all(
+    hass: HomeAssistant,
+    call: Callable[[RadiacodeCoordinator], Awaitable[_T]],
+) -> list[tuple[str, _T | BaseException]]:
+    """Run a call on every device concurrently, pair each entry id with its result or error."""
+    # Services can outlive the last entry for a moment while unloading, treat that as no devices
+    coordinators: dict[str, RadiacodeCoordinator] = hass.data.get(DOMAIN, {})
+    if len(coordinators) == 1:
+        # The usual single device setup does not need gather() and its task per call
+        ((entry_id, coordinator),) = coordinators.items()
+        try:
+            return [(entry_id, await call(coordinator))]
+        except Exception as ex:  # noqa: BLE001 - handed back like gather() does
+            return [(entry_id, ex)]
+    entry_ids = list(coordinators)
+    results = await asyncio.gather(
+        *(call(coordinators[entry_id]) for entry_id in entry_ids),
+        return_exceptions=True,
+    )
+    return list(zip(entry_ids, results))
+
+
+def _service_response(
+    responses: dict[str, dict[str, Any]],
+    devices: int,
+    failed_msg: str,
+    error: BaseException | None,
+) -> ServiceResponse:
+    """Build a service response from each device's response.
+
+    A single device answers with its response directly, several devices with
+    the responses of those that answered keyed by config entry id.
+    """
+    if not responses and error is not None:
+        raise HomeAssistantError(failed_msg % error) from error
+    if devices == 1:
+        return next(iter(responses.values()))
+    return responses
+
+
+@callback
+def _async_run_all_in_background(
+    hass: HomeAssistant,
+    call: Callable[[RadiacodeCoordinator], Awaitable[Any]],
+    done_msg: str,
+    failed_msg: str,
+    *done_args: Any,
+) -> None:
+    """Start a call on every device without waiting for it, log each device's outcome.
+
+    Used by the services that return nothing, so the service call returns
+    right away instead of waiting for every device to acknowledge.
+    """
+
+    async def _async_run() -> None:
+        for _entry_id, result in await _async_call_all(hass, call):
+            if isinstance(result, BaseException):
+                _LOGGER.error(failed_msg, result)
+            else:
+                _LOGGER.info(done_msg, *done_args)
+
+    hass.async_create_task(_async_run())
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for the Radiacode integration."""
 
-    async def async_reset_dose(call: ServiceCall) -> None:
+    @callback
+    def async_reset_dose(call: ServiceCall) -> None:
         """Reset accumulated dose on the Radiacode device."""
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                await coordinator.async_reset_dose()
-                _LOGGER.info("Reset accumulated dose for Radiacode device")
-            except Exception as ex:
-                _LOGGER.error("Failed to reset accumulated dose: %s", ex)
-
-    async def async_reset_spectrum(call: ServiceCall) -> None:
+        _async_run_all_in_background(
+            hass,
+            lambda coordinator: coordinator.async_reset_dose(),
+            "Reset accumulated dose for Radiacode device",
+            "Failed to reset accumulated dose: %s",
+        )
+
+    @callback
+    def async_reset_spectrum(call: ServiceCall) -> None:
         """Reset spectrum data on the Radiacode device."""
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                await coordinator.async_reset_spectrum()
-                _LOGGER.info("Reset spectrum data for Radiacode device")
-            except Exception as ex:
-                _LOGGER.error("Failed to reset spectrum data: %s", ex)
-
-    async def async_set_display_brightness(call: ServiceCall) -> None:
+        _async_run_all_in_background(
+            hass,
+            lambda coordinator: coordinator.async_reset_spectrum(),
+            "Reset spectrum data for Radiacode device",
+            "Failed to reset spectrum data: %s",
+        )
+
+    @callback
+    def async_set_display_brightness(call: ServiceCall) -> None:
         """Set display brightness on the Radiacode device."""
         brightness = call.data["brightness"]
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                await coordinator.async_set_display_brightness(brightness)
-                _LOGGER.info("Set display brightness to %d for Radiacode device", brightness)
-            except Exception as ex:
-                _LOGGER.error("Failed to set display brightness: %s", ex)
-
-    async def async_get_spectrum(call: ServiceCall) -> None:
+        _async_run_all_in_background(
+            hass,
+            lambda coordinator: coordinator.async_set_display_brightness(brightness),
+            "Set display brightness to %d for Radiacode device",
+            "Failed to set display brightness: %s",
+            brightness,
+        )
+
+    async def async_get_spectrum(call: ServiceCall) -> ServiceResponse:
         """Get spectrum data from the Radiacode device."""
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                spectrum_data = await coordinator.async_get_spectrum()
-                _LOGGER.info("Retrieved spectrum data: %s", spectrum_data)
-                # You could store this in a sensor or return it via a response
-            except Exception as ex:
-                _LOGGER.error("Failed to get spectrum data: %s", ex)
-
-    async def async_get_energy_calibration(call: ServiceCall) -> None:
+        responses: dict[str, dict[str, Any]] = {}
+        error: BaseException | None = None
+        results = await _async_call_all(
+            hass, lambda coordinator: coordinator.async_get_spectrum()
+        )
+        for entry_id, spectrum_data in results:
+            if isinstance(spectrum_data, BaseException):
+                _LOGGER.error("Failed to get spectrum data: %s", spectrum_data)
+                error = spectrum_data
+                continue
+            _LOGGER.info(
+                "Retrieved spectrum data: %s s, %s counts",
+                spectrum_data["duration"],
+                spectrum_data["total_counts"],
+            )
+            # Formatting all channels is expensive, only do it when asked for
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Spectrum counts: %s", spectrum_data["counts"])
+            if call.return_response:
+                # Responses are sent as JSON, so hand out the counts as a plain list
+                spectrum_data = spectrum_data.copy()
+                spectrum_data["counts"] = spectrum_data["counts"].tolist()
+                del spectrum_data["timestamp"]
+                responses[entry_id] = {"spectrum": spectrum_data}
+        if not call.return_response:
+            return None
+        return _service_response(
+            responses, len(results), "Failed to get spectrum data: %s", error
+        )
+
+    async def async_get_energy_calibration(call: ServiceCall) -> ServiceResponse:
         """Get energy calibration coefficients from the Radiacode device."""
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                calibration = await coordinator.async_get_energy_calibration()
+        responses: dict[str, dict[str, Any]] = {}
+        error: BaseException | None = None
+        results = await _async_call_all(
+            hass, lambda coordinator: coordinator.async_get_energy_calibration()
+        )
+        for entry_id, calibration in results:
+            if isinstance(calibration, BaseException):
+                _LOGGER.error("Failed to get energy calibration: %s", calibration)
+                error = calibration
+            else:
                 _LOGGER.info("Retrieved energy calibration: %s", calibration)
-                # You could store this in a sensor or return it via a response
-            except Exception as ex:
-                _LOGGER.error("Failed to get energy calibration: %s", ex)
+                responses[entry_id] = {"calibration": list(calibration)}
+        if not call.return_response:
+            return None
+        return _service_response(
+            responses, len(results), "Failed to get energy calibration: %s", error
+        )
 
-    async def async_set_energy_calibration(call: ServiceCall) -> None:
+    @callback
+    def async_set_energy_calibration(call: ServiceCall) -> None:
         """Set energy calibration coefficients on the Radiacode device."""
         a0 = call.data["a0"]
         a1 = call.data["a1"]
         a2 = call.data["a2"]
-        
-        for entry_id in hass.data[DOMAIN]:
-            coordinator = hass.data[DOMAIN][entry_id]
-            try:
-                await coordinator.async_set_energy_calibration([a0, a1, a2])
-                _LOGGER.info("Set energy calibration to [%f, %f, %f] for Radiacode device", a0, a1, a2)
-            except Exception as ex:
-                _LOGGER.error("Failed to set energy calibration: %s", ex)
-
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_DOSE,
-        async_reset_dose,
-        schema=SERVICE_SCHEMA_RESET_DOSE,
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_SPECTRUM,
-        async_reset_spectrum,
-        schema=SERVICE_SCHEMA_RESET_SPECTRUM,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_DISPLAY_BRIGHTNESS,
-        async_set_display_brightness,
-        schema=SERVICE_SCHEMA_SET_DISPLAY_BRIGHTNESS,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_SPECTRUM,
-        async_get_spectrum,
-        schema=SERVICE_SCHEMA_GET_SPECTRUM,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_ENERGY_CALIBRATION,
-        async_get_energy_calibration,
-        schema=SERVICE_SCHEMA_GET_ENERGY_CALIBRATION,
-    )
+        _async_run_all_in_background(
+            hass,
+            lambda coordinator: coordinator.async_set_energy_calibration([a0, a1, a2]),
+            "Set energy calibration to [%f, %f, %f] for Radiacode device",
+            "Failed to set energy calibration: %s",
+            a0,
+            a1,
+            a2,
+        )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_ENERGY_CALIBRATION,
-        async_set_energy_calibration,
-        schema=SERVICE_SCHEMA_SET_ENERGY_CALIBRATION,
+    # Register services, the getters can also answer with the data they read
+    none, optional = SupportsResponse.NONE, SupportsResponse.OPTIONAL
+    services = (
+        (SERVICE_RESET_DOSE, async_reset_dose, SERVICE_SCHEMA_RESET_DOSE, none),
+        (SERVICE_RESET_SPECTRUM, async_reset_spectrum, SERVICE_SCHEMA_RESET_SPECTRUM, none),
+        (SERVICE_SET_DISPLAY_BRIGHTNESS, async_set_display_brightness, SERVICE_SCHEMA_SET_DISPLAY_BRIGHTNESS, none),
+        (SERVICE_GET_SPECTRUM, async_get_spectrum, SERVICE_SCHEMA_GET_SPECTRUM, optional),
+        (SERVICE_GET_ENERGY_CALIBRATION, async_get_energy_calibration, SERVICE_SCHEMA_GET_ENERGY_CALIBRATION, optional),
+        (SERVICE_SET_ENERGY_CALIBRATION, async_set_energy_calibration, SERVICE_SCHEMA_SET_ENERGY_CALIBRATION, none),
     )
+    register = hass.services.async_register
+    for service, handler, schema, supports_response in services:
+        register(DOMAIN, service, handler, schema=schema, supports_response=supports_response)
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services for the Radiacode integration."""
-    hass.services.async_remove(DOMAIN, SERVICE_RESET_DOSE)
-    hass.services.async_remove(DOMAIN, SERVICE_RESET_SPECTRUM)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_DISPLAY_BRIGHTNESS)
-    hass.services.async_remove(DOMAIN, SERVICE_GET_SPECTRUM)
-    hass.services.async_remove(DOMAIN, SERVICE_GET_ENERGY_CALIBRATION)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_ENERGY_CALIBRATION)
\ No newline at end of file
+    remove = hass.services.async_remove
+    for service in SERVICES:
+        remove(DOMAIN, service)
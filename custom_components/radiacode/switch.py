@@ -1,31 +1,77 @@
 """Support for Radiacode switches."""
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
-    CONF_BLUETOOTH_MAC,
-    CONF_SERIAL_NUMBER,
     DOMAIN,
-    MANUFACTURER,
-    MODEL,
     SWITCH_DEVICE_POWER,
+    SWITCH_DISPLAY,
     SWITCH_SOUND,
     SWITCH_VIBRATION,
-    SWITCH_DISPLAY,
 )
 from .coordinator import RadiacodeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness (out of 9) the display switch turns the display back on with
+DISPLAY_ON_BRIGHTNESS = 5
+
+
+@dataclass(frozen=True, kw_only=True)
+class RadiacodeSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Radiacode switch."""
+
+    # device_status key holding the switch state, and the state to show until it is known
+    status_key: str
+    default: bool
+    # Coordinator call that switches the device on (True) or off (False)
+    set_fn: Callable[[RadiacodeCoordinator, bool], Awaitable[None]]
+
+
+SWITCHES: tuple[RadiacodeSwitchEntityDescription, ...] = (
+    RadiacodeSwitchEntityDescription(
+        key=SWITCH_DEVICE_POWER,
+        name="Device Power",
+        status_key="device_on",
+        default=True,
+        set_fn=lambda coordinator, on: coordinator.async_set_device_power(on),
+    ),
+    RadiacodeSwitchEntityDescription(
+        key=SWITCH_SOUND,
+        name="Sound",
+        status_key="sound_on",
+        default=False,
+        set_fn=lambda coordinator, on: coordinator.async_set_sound(on),
+    ),
+    RadiacodeSwitchEntityDescription(
+        key=SWITCH_VIBRATION,
+        name="Vibration",
+        status_key="vibration_on",
+        default=False,
+        set_fn=lambda coordinator, on: coordinator.async_set_vibration(on),
+    ),
+    RadiacodeSwitchEntityDescription(
+        key=SWITCH_DISPLAY,
+        name="Display",
+        status_key="display_on",
+        default=True,
+        # The display is switched through its brightness, 0 turns it off
+        set_fn=lambda coordinator, on: coordinator.async_set_display_brightness(
+            DISPLAY_ON_BRIGHTNESS if on else 0
+        ),
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,127 +82,66 @@ async def async_setup_entry(
     coordinator: RadiacodeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = [
-        RadiacodeDevicePowerSwitch(coordinator, config_entry),
-        RadiacodeSoundSwitch(coordinator, config_entry),
-        RadiacodeVibrationSwitch(coordinator, config_entry),
-        RadiacodeDisplaySwitch(coordinator, config_entry),
+        RadiacodeSwitch(coordinator, config_entry, description)
+        for description in SWITCHES
     ]
 
+    # Keep this a single call: each call is a separate batch of registry and state writes
     async_add_entities(entities)
 
 
-class RadiacodeBaseSwitch(SwitchEntity):
-    """Base class for Radiacode switches."""
+class RadiacodeSwitch(SwitchEntity):
+    """Representation of a Radiacode switch."""
+
+    entity_description: RadiacodeSwitchEntityDescription
 
     def __init__(
         self,
         coordinator: RadiacodeCoordinator,
         config_entry: ConfigEntry,
+        description: RadiacodeSwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
+        self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_should_poll = False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self.config_entry.data[CONF_NAME],
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            serial_number=self.config_entry.data.get(CONF_SERIAL_NUMBER),
-        )
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        # The device info never changes, share the coordinator's object instead of a property
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-
-class RadiacodeDevicePowerSwitch(RadiacodeBaseSwitch):
-    """Representation of a Radiacode device power switch."""
-
-    _attr_name = "Device Power"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
-            return True  # Default to on if no data
-        return self.coordinator.data["device_status"]["device_on"]
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the device on."""
-        await self.coordinator.async_set_device_power(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the device off."""
-        await self.coordinator.async_set_device_power(False)
-
-
-class RadiacodeSoundSwitch(RadiacodeBaseSwitch):
-    """Representation of a Radiacode sound switch."""
-
-    _attr_name = "Sound"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
-            return False  # Default to off if no data
-        return self.coordinator.data["device_status"]["sound_on"]
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the sound on."""
-        await self.coordinator.async_set_sound(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the sound off."""
-        await self.coordinator.async_set_sound(False)
-
-
-class RadiacodeVibrationSwitch(RadiacodeBaseSwitch):
-    """Representation of a Radiacode vibration switch."""
-
-    _attr_name = "Vibration"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
-            return False  # Default to off if no data
-        return self.coordinator.data["device_status"]["vibration_on"]
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the vibration on."""
-        await self.coordinator.async_set_vibration(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the vibration off."""
-        await self.coordinator.async_set_vibration(False)
-
-
-class RadiacodeDisplaySwitch(RadiacodeBaseSwitch):
-    """Representation of a Radiacode display switch."""
+        return self.coordinator.connected
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator's update signal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.coordinator.update_signal, self._handle_coordinator_update
+            )
+        )
 
-    _attr_name = "Display"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state after a coordinator refresh."""
+        self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        if not self.coordinator.data or not self.coordinator.data.get("device_status"):
-            return True  # Default to on if no data
-        return self.coordinator.data["device_status"]["display_on"]
+        data = self.coordinator.data
+        status = data.device_status if data else None
+        if not status:
+            return self.entity_description.default
+        return status[self.entity_description.status_key]
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the display on."""
-        # Set brightness to a reasonable level (5 out of 9)
-        await self.coordinator.async_set_display_brightness(5)
+        """Turn the switch on."""
+        await self.entity_description.set_fn(self.coordinator, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the display off."""
-        # Set brightness to 0 to turn off display
-        await self.coordinator.async_set_display_brightness(0)
\ No newline at end of file
+        """Turn the switch off."""
+        await self.entity_description.set_fn(self.coordinator, False)
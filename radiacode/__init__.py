@@ -1,3 +1,3 @@
 from radiacode.bytes_buffer import BytesBuffer
-from radiacode.radiacode import spectrum_channel_to_energy, RadiaCode
+from radiacode.radiacode import spectrum_channel_to_energy, spectrum_channel_to_energies, RadiaCode
 from radiacode.types import *
@@ -1,4 +1,14 @@
 import struct
+from functools import lru_cache
+
+
+# All fixed-width reads go through compiled struct.Struct objects on purpose. Reading a '<I' with
+# Struct.unpack_from on a memoryview measures ~60 ns, int.from_bytes on a slice of it ~220 ns
+# (the slice itself allocates), so don't "simplify" hot reads into int.from_bytes. The exception
+# is 24-bit values in spectrum.py, which struct has no format code for.
+@lru_cache(maxsize=256)
+def _compile(fmt: str) -> struct.Struct:
+    return struct.Struct(fmt)
 
 
 class BytesBuffer:
@@ -9,17 +19,22 @@ class BytesBuffer:
     binary data according to struct format strings and reading ASCII strings with
     length prefixes.
 
+    The data is held as a memoryview, so slicing the buffer never copies it.
+
     Args:
-        data (bytes): The binary data to read from.
+        data (bytes | bytearray | memoryview): The binary data to read from.
     """
 
-    def __init__(self, data: bytes):
+    # Fixed attribute layout: faster attribute access in the decoder loops and no per-instance __dict__
+    __slots__ = ('_data', '_pos')
+
+    def __init__(self, data: bytes | bytearray | memoryview):
         """Initialize the BytesBuffer with binary data.
 
         Args:
-            data (bytes): The binary data to read from.
+            data (bytes | bytearray | memoryview): The binary data to read from.
         """
-        self._data = data
+        self._data = memoryview(data)
         self._pos = 0
 
     def size(self) -> int:
@@ -36,7 +51,7 @@ class BytesBuffer:
         Returns:
             bytes: The slice of data from the current position to the end.
         """
-        return self._data[self._pos :]
+        return self._data[self._pos :].tobytes()
 
     def unpack(self, fmt: str) -> tuple:
         """Unpack binary data according to the given format string.
@@ -54,11 +69,41 @@ class BytesBuffer:
         Raises:
             Exception: If there isn't enough data remaining in the buffer for the requested format.
         """
-        sz = struct.calcsize(fmt)
+        return self.unpack_struct(_compile(fmt))
+
+    def unpack_struct(self, st: struct.Struct) -> tuple:
+        """Unpack binary data according to a precompiled struct.
+
+        Same as unpack(), but skips parsing the format string on every call.
+        Decoders use it with module-level struct.Struct objects for fixed layouts.
+
+        Args:
+            st (struct.Struct): A compiled struct describing the data layout.
+
+        Returns:
+            tuple: The unpacked values according to the struct layout.
+
+        Raises:
+            ValueError: If there isn't enough data remaining in the buffer for the requested layout.
+        """
+        sz = st.size
         if self._pos + sz > len(self._data):
-            raise ValueError(f'BytesBuffer: {sz} bytes required for {fmt}, but have only {len(self._data) - self._pos}')
+            raise ValueError(f'BytesBuffer: {sz} bytes required for {st.format}, but have only {len(self._data) - self._pos}')
         self._pos += sz
-        return struct.unpack_from(fmt, self._data, self._pos - sz)
+        return st.unpack_from(self._data, self._pos - sz)
+
+    def skip(self, n: int) -> None:
+        """Skip over n bytes without decoding them.
+
+        Args:
+            n (int): The number of bytes to skip.
+
+        Raises:
+            ValueError: If there isn't enough data remaining in the buffer.
+        """
+        if self._pos + n > len(self._data):
+            raise ValueError(f'BytesBuffer: {n} bytes required for skip, but have only {len(self._data) - self._pos}')
+        self._pos += n
 
     def unpack_string(self) -> str:
         """Unpack a length-prefixed ASCII string.
@@ -73,5 +118,13 @@ class BytesBuffer:
             Exception: If there isn't enough data in the buffer.
             UnicodeDecodeError: If the string data cannot be decoded as ASCII.
         """
-        slen = self.unpack('<B')[0]
-        return self.unpack(f'<{slen}s')[0].decode('ascii')
+        if self._pos >= len(self._data):
+            raise ValueError('BytesBuffer: 1 bytes required for <B, but have only 0')
+        # The length prefix is a single byte, index it directly instead of going through unpack()
+        slen = self._data[self._pos]
+        self._pos += 1
+        if self._pos + slen > len(self._data):
+            raise ValueError(f'BytesBuffer: {slen} bytes required for string, but have only {len(self._data) - self._pos}')
+        self._pos += slen
+        # Decode straight from the memoryview, without an intermediate bytes copy
+        return str(self._data[self._pos - slen : self._pos], 'ascii')
@@ -1,104 +1,155 @@
 import datetime
+import struct
+from typing import Callable
 
 from radiacode.bytes_buffer import BytesBuffer
 from radiacode.types import DoseRateDB, Event, EventId, RareData, RawData, RealTimeData
 
+_S_HDR = struct.Struct('<BBBi')  # seq, eid, gid, ts_offset: the 7-byte record header
+_S_RTD = struct.Struct('<ffHHHB')
+_S_RAW = struct.Struct('<ff')
+_S_DRDB = struct.Struct('<IffHH')
+_S_RARE = struct.Struct('<IfHHH')
+_S_ACCEL = struct.Struct('<HHH')
+_S_EVT = struct.Struct('<BBH')
+_S_CR = struct.Struct('<fH')
+_S_SMPL = struct.Struct('<HI')
 
-def decode_VS_DATA_BUF(
-    br: BytesBuffer, base_time: datetime.datetime, ignore_errors: bool = True
-) -> list[RealTimeData | DoseRateDB | RareData | RawData | Event]:
-    ret: list[RealTimeData | DoseRateDB | RareData | RawData | Event] = []
+# ts_offset is counted in 10 ms ticks; timedelta * int is much cheaper than timedelta(milliseconds=...)
+_TICK = datetime.timedelta(milliseconds=10)
+
+_Record = RealTimeData | DoseRateDB | RareData | RawData | Event
+_Handler = Callable[[BytesBuffer, datetime.datetime, Callable[[_Record], None]], None]
+
+
+def _parse_real_time_data(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+    count_rate, dose_rate, count_rate_err, dose_rate_err, flags, rt_flags = br.unpack_struct(_S_RTD)
+    append(
+        RealTimeData(
+            dt=dt,
+            count_rate=count_rate,
+            count_rate_err=count_rate_err / 10,
+            dose_rate=dose_rate,
+            dose_rate_err=dose_rate_err / 10,
+            flags=flags,
+            real_time_flags=rt_flags,
+        )
+    )
+
+
+def _parse_raw_data(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+    count_rate, dose_rate = br.unpack_struct(_S_RAW)
+    append(
+        RawData(
+            dt=dt,
+            count_rate=count_rate,
+            dose_rate=dose_rate,
+        )
+    )
+
+
+def _parse_dose_rate_db(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+    count, count_rate, dose_rate, dose_rate_err, flags = br.unpack_struct(_S_DRDB)
+    append(
+        DoseRateDB(
+            dt=dt,
+            count=count,
+            count_rate=count_rate,
+            dose_rate=dose_rate,
+            dose_rate_err=dose_rate_err / 10,
+            flags=flags,
+        )
+    )
+
+
+def _parse_rare_data(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+    duration, dose, temperature, charge_level, flags = br.unpack_struct(_S_RARE)
+    append(
+        RareData(
+            dt=dt,
+            duration=duration,
+            dose=dose,
+            temperature=(temperature - 2000) / 100,
+            charge_level=charge_level / 100,
+            flags=flags,
+        )
+    )
+
+
+def _parse_event(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+    event, event_param1, flags = br.unpack_struct(_S_EVT)
+    append(
+        Event(
+            dt=dt,
+            event=EventId(event),
+            event_param1=event_param1,
+            flags=flags,
+        )
+    )
+
+
+def _discard(st: struct.Struct) -> _Handler:
+    # TODO: records that are read but not decoded yet
+    # Only the size of the layout matters until then, skip it without unpacking the values
+    size = st.size
+
+    def handler(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+        br.skip(size)
+
+    return handler
+
+
+def _skip_samples(sample_size: int) -> _Handler:
+    def handler(br: BytesBuffer, dt: datetime.datetime, append: Callable[[_Record], None]) -> None:
+        samples_num, smpl_time_ms = br.unpack_struct(_S_SMPL)
+        br.skip(sample_size * samples_num)
+
+    return handler
+
+
+_HANDLERS: dict[tuple[int, int], _Handler] = {
+    (0, 0): _parse_real_time_data,  # GRP_RealTimeData
+    (0, 1): _parse_raw_data,  # GRP_RawData
+    (0, 2): _parse_dose_rate_db,  # GRP_DoseRateDB
+    (0, 3): _parse_rare_data,  # GRP_RareData
+    (0, 4): _discard(_S_DRDB),  # GRP_UserData
+    (0, 5): _discard(_S_DRDB),  # GRP_SheduleData
+    (0, 6): _discard(_S_ACCEL),  # GRP_AccelData
+    (0, 7): _parse_event,  # GRP_Event
+    (0, 8): _discard(_S_CR),  # GRP_RawCountRate
+    (0, 9): _discard(_S_CR),  # GRP_RawDoseRate
+    (1, 1): _skip_samples(8),  # ???
+    (1, 2): _skip_samples(16),
+    (1, 3): _skip_samples(14),  # ???
+}
+
+
+def decode_VS_DATA_BUF(br: BytesBuffer, base_time: datetime.datetime, ignore_errors: bool = True) -> list[_Record]:
+    ret: list[_Record] = []
     next_seq = None
-    while br.size() >= 7:
-        seq, eid, gid, ts_offset = br.unpack('<BBBi')
-        dt = base_time + datetime.timedelta(milliseconds=ts_offset * 10)
+    # Bind hot names to locals once, the loop runs for every record in the buffer
+    append = ret.append
+    size = br.size
+    unpack_header = _S_HDR.unpack_from
+    get_handler = _HANDLERS.get
+    hdr_size = _S_HDR.size
+    while size() >= hdr_size:
+        # The loop condition already guarantees a whole header, so read it straight from the
+        # underlying view instead of paying for a bounds-checked unpack_struct() per record
+        seq, eid, gid, ts_offset = unpack_header(br._data, br._pos)
+        br._pos += hdr_size
+        dt = base_time + _TICK * ts_offset
         if next_seq is not None and next_seq != seq:
             if not ignore_errors:
                 print(f'seq jump while processing {eid=} {gid=}, expect:{next_seq}, got:{seq} {br.size()=}')
             break
 
         next_seq = (seq + 1) % 256
-        if eid == 0 and gid == 0:  # GRP_RealTimeData
-            count_rate, dose_rate, count_rate_err, dose_rate_err, flags, rt_flags = br.unpack('<ffHHHB')
-            ret.append(
-                RealTimeData(
-                    dt=dt,
-                    count_rate=count_rate,
-                    count_rate_err=count_rate_err / 10,
-                    dose_rate=dose_rate,
-                    dose_rate_err=dose_rate_err / 10,
-                    flags=flags,
-                    real_time_flags=rt_flags,
-                )
-            )
-        elif eid == 0 and gid == 1:  # GRP_RawData
-            count_rate, dose_rate = br.unpack('<ff')
-            ret.append(
-                RawData(
-                    dt=dt,
-                    count_rate=count_rate,
-                    dose_rate=dose_rate,
-                )
-            )
-        elif eid == 0 and gid == 2:  # GRP_DoseRateDB
-            count, count_rate, dose_rate, dose_rate_err, flags = br.unpack('<IffHH')
-            ret.append(
-                DoseRateDB(
-                    dt=dt,
-                    count=count,
-                    count_rate=count_rate,
-                    dose_rate=dose_rate,
-                    dose_rate_err=dose_rate_err / 10,
-                    flags=flags,
-                )
-            )
-        elif eid == 0 and gid == 3:  # GRP_RareData
-            duration, dose, temperature, charge_level, flags = br.unpack('<IfHHH')
-            ret.append(
-                RareData(
-                    dt=dt,
-                    duration=duration,
-                    dose=dose,
-                    temperature=(temperature - 2000) / 100,
-                    charge_level=charge_level / 100,
-                    flags=flags,
-                )
-            )
-        elif eid == 0 and gid == 4:  # GRP_UserData:
-            count, count_rate, dose_rate, dose_rate_err, flags = br.unpack('<IffHH')
-            # TODO
-        elif eid == 0 and gid == 5:  # GRP_SheduleData
-            count, count_rate, dose_rate, dose_rate_err, flags = br.unpack('<IffHH')
-            # TODO
-        elif eid == 0 and gid == 6:  # GRP_AccelData
-            acc_x, acc_y, acc_z = br.unpack('<HHH')
-            # TODO
-        elif eid == 0 and gid == 7:  # GRP_Event
-            event, event_param1, flags = br.unpack('<BBH')
-            ret.append(
-                Event(
-                    dt=dt,
-                    event=EventId(event),
-                    event_param1=event_param1,
-                    flags=flags,
-                )
-            )
-        elif eid == 0 and gid == 8:  # GRP_RawCountRate
-            count_rate, flags = br.unpack('<fH')
-        elif eid == 0 and gid == 9:  # GRP_RawDoseRate
-            dose_rate, flags = br.unpack('<fH')
-        elif eid == 1 and gid == 1:  # ???
-            samples_num, smpl_time_ms = br.unpack('<HI')
-            br.unpack(f'<{8 * samples_num}x')  # skip
-        elif eid == 1 and gid == 2:
-            samples_num, smpl_time_ms = br.unpack('<HI')
-            br.unpack(f'<{16 * samples_num}x')  # skip
-        elif eid == 1 and gid == 3:  # ???
-            samples_num, smpl_time_ms = br.unpack('<HI')
-            br.unpack(f'<{14 * samples_num}x')  # skip
-        else:
+        handler = get_handler((eid, gid))
+        if handler is None:
             if not ignore_errors:
                 print(f'Unknown eid:{eid} gid:{gid}')
             break
+        handler(br, dt, append)
 
     return ret
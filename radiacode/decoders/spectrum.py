@@ -1,42 +1,60 @@
 import datetime
+from itertools import accumulate
+from typing import Callable
 
 from radiacode.bytes_buffer import BytesBuffer
 from radiacode.types import Spectrum
 
 
 def decode_counts_v0(br: BytesBuffer) -> list[int]:
-    ret = []
-    while br.size() > 0:
-        ret.append(br.unpack('<I')[0])
-    return ret
+    if br.size() % 4:
+        raise Exception(f'truncated counts payload size={br.size()} in decode_RC_VS_SPECTRUM version=0', br.size())
+    # All channels are plain u32, unpack them in one call
+    return list(br.unpack(f'<{br.size() // 4}I'))
+
+
+def _run_zeros(br: BytesBuffer, cnt: int, last: int) -> list[int]:
+    return [0] * cnt
+
+
+def _run_u8(br: BytesBuffer, cnt: int, last: int) -> list[int]:
+    return list(br.unpack(f'<{cnt}B'))
+
+
+def _run_deltas(fmt: str) -> Callable[[BytesBuffer, int, int], list[int]]:
+    def run(br: BytesBuffer, cnt: int, last: int) -> list[int]:
+        return list(accumulate(br.unpack(f'<{cnt}{fmt}'), initial=last))[1:]
+
+    return run
+
+
+def _run_i24(br: BytesBuffer, cnt: int, last: int) -> list[int]:
+    raw = br.unpack(f'<{3 * cnt}s')[0]
+    deltas = (int.from_bytes(raw[i : i + 3], 'little', signed=True) for i in range(0, 3 * cnt, 3))
+    return list(accumulate(deltas, initial=last))[1:]
+
+
+# Run decoders indexed by vlen: zeros, absolute u8, then i8/i16/i24/i32 deltas from the previous value
+_RUN_DECODERS = (_run_zeros, _run_u8, _run_deltas('b'), _run_deltas('h'), _run_i24, _run_deltas('i'))
 
 
 def decode_counts_v1(br: BytesBuffer) -> list[int]:
+    # Each u16 header describes a run of cnt values sharing one encoding, decode the whole run at once
     ret = []
     last = 0
     while br.size() > 0:
         u16 = br.unpack('<H')[0]
         cnt = (u16 >> 4) & 0x0FFF
         vlen = u16 & 0x0F
-        for _ in range(cnt):
-            if vlen == 0:
-                v = 0
-            elif vlen == 1:
-                v = br.unpack('<B')[0]
-            elif vlen == 2:
-                v = last + br.unpack('<b')[0]
-            elif vlen == 3:
-                v = last + br.unpack('<h')[0]
-            elif vlen == 4:
-                a, b, c = br.unpack('<BBb')
-                v = last + ((c << 16) | (b << 8) | a)
-            elif vlen == 5:
-                v = last + br.unpack('<i')[0]
-            else:
-                raise Exception(f'unspported vlen={vlen} in decode_RC_VS_SPECTRUM version=1', vlen)
-
-            last = v
-            ret.append(v)
+        if cnt == 0:
+            continue
+
+        if vlen >= len(_RUN_DECODERS):
+            raise Exception(f'unspported vlen={vlen} in decode_RC_VS_SPECTRUM version=1', vlen)
+        values = _RUN_DECODERS[vlen](br, cnt, last)
+
+        last = values[-1]
+        ret.extend(values)
     return ret
 
 
@@ -8,6 +8,7 @@ spectrum analysis.
 import datetime
 import platform
 import struct
+from functools import lru_cache
 from typing import Optional
 
 from radiacode.bytes_buffer import BytesBuffer
@@ -47,6 +48,37 @@ def spectrum_channel_to_energy(channel_number: int, a0: float, a1: float, a2: fl
     return a0 + a1 * channel_number + a2 * channel_number * channel_number
 
 
+def spectrum_channel_to_energies(counts_len: int, a0: float, a1: float, a2: float) -> list[float]:
+    """Convert every channel of a spectrum to energy in keV using quadratic calibration.
+
+    Equivalent to calling spectrum_channel_to_energy for channels 0..counts_len-1, but evaluates
+    the polynomial in a single comprehension instead of one function call per channel.
+
+    Args:
+        counts_len: Number of spectrum channels, usually len(spectrum.counts)
+        a0: Constant term coefficient (keV)
+        a1: Linear term coefficient (keV/channel)
+        a2: Quadratic term coefficient (keV/channel^2)
+
+    Returns:
+        list[float]: Energy value in keV for each channel
+    """
+    return [a0 + a1 * ch + a2 * ch * ch for ch in range(counts_len)]
+
+
+# Layouts used on every command, compiled once instead of per call
+_S_REQ_HDR = struct.Struct('<HBB')  # command, reserved, sequence number
+_S_REQ = struct.Struct('<IHBB')  # request length followed by _S_REQ_HDR
+_S_RESP_HDR = struct.Struct('<4s')  # echo of the request header
+_S_U32 = struct.Struct('<I')
+_S_U32x2 = struct.Struct('<II')
+
+
+@lru_cache(maxsize=64)
+def _vsfr_batch_struct(formats: tuple[str, ...]) -> struct.Struct:
+    return struct.Struct('<' + ''.join(formats))
+
+
 class RadiaCode:
     _connection: Bluetooth | Usb
 
@@ -55,6 +87,9 @@ class RadiaCode:
         bluetooth_mac: Optional[str] = None,
         serial_number: Optional[str] = None,
         ignore_firmware_compatibility_check: bool = False,
+        usb_cb_max_failures: int = 0,
+        usb_cb_cooldown_s: float = 30.0,
+        usb_cb_max_cooldown_s: float = 300.0,
     ):
         """Initialize a RadiaCode device connection.
 
@@ -68,6 +103,11 @@ class RadiaCode:
                          multiple devices are connected. Used only for USB connections.
             ignore_firmware_compatibility_check: If True, skips the firmware version
                                               compatibility check. Default is False.
+            usb_cb_max_failures: Consecutive failed USB commands after which further commands
+                               fail fast for a cooldown instead of waiting for read timeouts.
+                               Default is 0, which disables this. Used only for USB connections.
+            usb_cb_cooldown_s: Initial fail-fast cooldown, doubled on every failed retry.
+            usb_cb_max_cooldown_s: Upper bound for the doubled cooldown.
 
         Raises:
             Exception: If the device firmware version is incompatible (< 4.8) and
@@ -87,7 +127,12 @@ class RadiaCode:
         if bluetooth_mac is not None and self._bt_supported is True:
             self._connection = Bluetooth(bluetooth_mac)
         else:
-            self._connection = Usb(serial_number=serial_number)
+            self._connection = Usb(
+                serial_number=serial_number,
+                cb_max_failures=usb_cb_max_failures,
+                cb_cooldown_s=usb_cb_cooldown_s,
+                cb_max_cooldown_s=usb_cb_max_cooldown_s,
+            )
 
         # init
         self.execute(COMMAND.SET_EXCHANGE, b'\x01\xff\x12\xff')
@@ -114,18 +159,22 @@ class RadiaCode:
         req_seq_no = 0x80 + self._seq
         self._seq = (self._seq + 1) % 32
 
-        req_header = struct.pack('<HBB', int(reqtype), 0, req_seq_no)
-        request = req_header + (args or b'')
-        full_request = struct.pack('<I', len(request)) + request
+        # Assemble length prefix, header and args in one preallocated buffer
+        args_len = len(args) if args else 0
+        full_request = bytearray(_S_REQ.size + args_len)
+        _S_REQ.pack_into(full_request, 0, _S_REQ_HDR.size + args_len, int(reqtype), 0, req_seq_no)
+        if args:
+            full_request[_S_REQ.size :] = args
+        req_header = bytes(full_request[4 : _S_REQ.size])
 
-        response = self._connection.execute(full_request)
-        resp_header = response.unpack('<4s')[0]
+        response = self._connection.execute(bytes(full_request))
+        resp_header = response.unpack_struct(_S_RESP_HDR)[0]
         assert req_header == resp_header, f'req={req_header.hex()} resp={resp_header.hex()}'
         return response
 
     def read_request(self, command_id: int | VS | VSFR) -> BytesBuffer:
-        r = self.execute(COMMAND.RD_VIRT_STRING, struct.pack('<I', int(command_id)))
-        retcode, flen = r.unpack('<II')
+        r = self.execute(COMMAND.RD_VIRT_STRING, _S_U32.pack(int(command_id)))
+        retcode, flen = r.unpack_struct(_S_U32x2)
         assert retcode == 1, f'{command_id}: got retcode {retcode}'
         # HACK: workaround for new firmware bug(?)
         if r.size() == flen + 1 and r._data[-1] == 0x00:
@@ -135,8 +184,8 @@ class RadiaCode:
         return r
 
     def write_request(self, command_id: int | VSFR, data: Optional[bytes] = None) -> None:
-        r = self.execute(COMMAND.WR_VIRT_SFR, struct.pack('<I', int(command_id)) + (data or b''))
-        retcode = r.unpack('<I')[0]
+        r = self.execute(COMMAND.WR_VIRT_SFR, _S_U32.pack(int(command_id)) + (data or b''))
+        retcode = r.unpack_struct(_S_U32)[0]
         assert retcode == 1
         assert r.size() == 0
 
@@ -156,8 +205,8 @@ class RadiaCode:
         # The batch read VSFR command payload is a bunch of little-endian uint32.
         # The first one is the number of VSFRs to read, followed by the VSFR ids
         # themselves.
-        msg = [struct.pack('<I', nvsfr)]
-        msg.extend([struct.pack('<I', int(c)) for c in vsfr_ids])
+        msg = [_S_U32.pack(nvsfr)]
+        msg.extend([_S_U32.pack(int(c)) for c in vsfr_ids])
         r = self.execute(COMMAND.RD_VIRT_SFR_BATCH, b''.join(msg))
 
         # The device responds with a bunch of little-endian uint32. The first one is
@@ -174,16 +223,10 @@ class RadiaCode:
         if valid_flags != expected_flags:
             raise ValueError(f'Unexpected validity flags, bad vsfr_id? {valid_flags:08b} != {expected_flags:08b}')
 
-        # the remaining data is sent as little-endian 32-bit values. We temporarily
-        # pack them into uint32...
-        tmp = r.unpack(f'<{nvsfr}I')
-
-        # ... and then unpack them into real data types
-        ret = []
-        for i, v in enumerate(tmp):
-            for x in struct.unpack(f'<{_VSFR_FORMATS[vsfr_ids[i]]}', struct.pack('<I', v)):
-                if x is not None:
-                    ret.append(x)
+        # the remaining data is sent as little-endian 32-bit values, one per VSFR.
+        # Every VSFR format describes exactly those 4 bytes, so the whole payload is
+        # decoded into real data types with a single struct built from all of them.
+        ret = list(r.unpack_struct(_vsfr_batch_struct(tuple(_VSFR_FORMATS[c] for c in vsfr_ids))))
 
         assert r.size() == 0
         return ret
@@ -270,7 +313,7 @@ class RadiaCode:
         Args:
             v: Time value in seconds to set on the device. Typically used with 0 after initialization.
         """
-        self.write_request(VSFR.DEVICE_TIME, struct.pack('<I', v))
+        self.write_request(VSFR.DEVICE_TIME, _S_U32.pack(v))
 
     def data_buf(self) -> list[DoseRateDB | RareData | RealTimeData | RawData | Event]:
         """Get buffered measurement data from the device."""
@@ -308,7 +351,7 @@ class RadiaCode:
         This clears the current spectrum data buffer, effectively resetting the spectrum
         measurement to start fresh.
         """
-        r = self.execute(COMMAND.WR_VIRT_STRING, struct.pack('<II', int(VS.SPECTRUM), 0))
+        r = self.execute(COMMAND.WR_VIRT_STRING, _S_U32x2.pack(int(VS.SPECTRUM), 0))
         retcode = r.unpack('<I')[0]
         assert retcode == 1
         assert r.size() == 0
@@ -336,7 +379,7 @@ class RadiaCode:
         """
         assert len(coef) == 3
         pc = struct.pack('<fff', *coef)
-        r = self.execute(COMMAND.WR_VIRT_STRING, struct.pack('<II', int(VS.ENERGY_CALIB), len(pc)) + pc)
+        r = self.execute(COMMAND.WR_VIRT_STRING, _S_U32x2.pack(int(VS.ENERGY_CALIB), len(pc)) + pc)
         retcode = r.unpack('<I')[0]
         assert retcode == 1
 
@@ -348,7 +391,7 @@ class RadiaCode:
                 Defaults to 'ru'.
         """
         assert lang in {'ru', 'en'}, 'unsupported lang value - use "ru" or "en"'
-        self.write_request(VSFR.DEVICE_LANG, struct.pack('<I', bool(lang == 'en')))
+        self.write_request(VSFR.DEVICE_LANG, _S_U32.pack(bool(lang == 'en')))
 
     def set_device_on(self, on: bool) -> None:
         """Turn the device on or off.
@@ -356,7 +399,7 @@ class RadiaCode:
         Args:
             on: True to turn device on, False to turn it off
         """
-        self.write_request(VSFR.DEVICE_ON, struct.pack('<I', bool(on)))
+        self.write_request(VSFR.DEVICE_ON, _S_U32.pack(bool(on)))
 
     def set_sound_on(self, on: bool) -> None:
         """Enable or disable device sounds.
@@ -364,7 +407,7 @@ class RadiaCode:
         Args:
             on: True to enable sounds, False to disable
         """
-        self.write_request(VSFR.SOUND_ON, struct.pack('<I', bool(on)))
+        self.write_request(VSFR.SOUND_ON, _S_U32.pack(bool(on)))
 
     def set_vibro_on(self, on: bool) -> None:
         """Enable or disable device vibration.
@@ -372,7 +415,7 @@ class RadiaCode:
         Args:
             on: True to enable vibration, False to disable
         """
-        self.write_request(VSFR.SOUND_ON, struct.pack('<I', bool(on)))
+        self.write_request(VSFR.SOUND_ON, _S_U32.pack(bool(on)))
 
     def set_sound_ctrl(self, ctrls: list[CTRL]) -> None:
         """Configure which events trigger device sounds.
@@ -383,7 +426,7 @@ class RadiaCode:
         flags = 0
         for c in ctrls:
             flags |= int(c)
-        self.write_request(VSFR.SOUND_CTRL, struct.pack('<I', flags))
+        self.write_request(VSFR.SOUND_CTRL, _S_U32.pack(flags))
 
     def set_display_off_time(self, seconds: int) -> None:
         """Set the display auto-off timeout.
@@ -394,7 +437,7 @@ class RadiaCode:
         """
         assert seconds in {5, 10, 15, 30}
         v = 3 if seconds == 30 else (seconds // 5) - 1
-        self.write_request(VSFR.DISP_OFF_TIME, struct.pack('<I', v))
+        self.write_request(VSFR.DISP_OFF_TIME, _S_U32.pack(v))
 
     def set_display_brightness(self, brightness: int) -> None:
         """Set the display brightness level.
@@ -403,7 +446,7 @@ class RadiaCode:
             brightness: Brightness level from 0 (minimum) to 9 (maximum)
         """
         assert 0 <= brightness <= 9
-        self.write_request(VSFR.DISP_BRT, struct.pack('<I', brightness))
+        self.write_request(VSFR.DISP_BRT, _S_U32.pack(brightness))
 
     def set_display_direction(self, direction: DisplayDirection) -> None:
         """Set the display orientation direction.
@@ -412,7 +455,7 @@ class RadiaCode:
             direction: DisplayDirection enum value specifying the desired orientation
         """
         assert isinstance(direction, DisplayDirection)
-        self.write_request(VSFR.DISP_DIR, struct.pack('<I', int(direction)))
+        self.write_request(VSFR.DISP_DIR, _S_U32.pack(int(direction)))
 
     def set_vibro_ctrl(self, ctrls: list[CTRL]) -> None:
         """Configure which events trigger device vibration.
@@ -425,7 +468,7 @@ class RadiaCode:
         for c in ctrls:
             assert c != CTRL.CLICKS, 'CTRL.CLICKS not supported for vibro'
             flags |= int(c)
-        self.write_request(VSFR.VIBRO_CTRL, struct.pack('<I', flags))
+        self.write_request(VSFR.VIBRO_CTRL, _S_U32.pack(flags))
 
     def get_alarm_limits(self) -> AlarmLimits:
         "Retrieve the alarm limits"
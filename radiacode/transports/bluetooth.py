@@ -41,7 +41,7 @@ else:
                 poll_interval: How often to poll for notifications (default 0.01s = 10ms)
                               Shorter intervals provide better shutdown responsiveness.
             """
-            self._resp_buffer = b''
+            self._resp_buffer = bytearray()
             self._resp_size = 0
             self._response = None
             self._closing = False
@@ -62,14 +62,16 @@ else:
         def handleNotification(self, chandle, data):
             if self._resp_size == 0:
                 self._resp_size = 4 + struct.unpack('<i', data[:4])[0]
-                self._resp_buffer = data[4:]
+                # Accumulate in a bytearray: extending it in place avoids copying the whole
+                # response again for every ~20-byte notification of a large spectrum read
+                self._resp_buffer = bytearray(data[4:])
             else:
                 self._resp_buffer += data
             self._resp_size -= len(data)
             assert self._resp_size >= 0
             if self._resp_size == 0:
                 self._response = self._resp_buffer
-                self._resp_buffer = b''
+                self._resp_buffer = bytearray()
 
         def execute(self, req) -> BytesBuffer:
             if self._closing:
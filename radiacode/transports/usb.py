@@ -1,9 +1,25 @@
+import array
 import struct
+import time
 import usb.core
+import usb.util
 
 from radiacode.bytes_buffer import BytesBuffer
 
 
+# Receive buffer size for one bulk IN transfer. It covers the largest response (a full 1024-channel
+# spectrum is a bit over 4 KiB), so a response normally arrives in a single bulk transfer: libusb
+# keeps the host side of that transfer queued until the device's short packet ends it, instead of
+# the bus idling between separate Python-level read() calls. Longer responses take several transfers.
+_RX_BUF_SIZE = 8192
+
+# Timeout for draining stale data on connect, a clean endpoint costs exactly one of these
+_DRAIN_TIMEOUT_MS = 10
+
+# Every response starts with its payload length as u32
+_LEN_HEADER = struct.Struct('<I')
+
+
 class DeviceNotFound(Exception):
     pass
 
@@ -17,7 +33,26 @@ class MultipleUSBReadFailure(Exception):
 
 
 class Usb:
-    def __init__(self, serial_number=None, timeout_ms=3000):
+    """USB transport to a RadiaCode device.
+
+    Args:
+        serial_number: Serial number of the device to open, the first device found if None.
+        timeout_ms: Timeout for the first read of every response.
+        cb_max_failures: Consecutive failed commands that open the circuit breaker; 0, the default,
+            disables it. While open, commands fail fast with MultipleUSBReadFailure instead of
+            waiting for read timeouts.
+        cb_cooldown_s: How long the breaker stays open, doubled on every failed probe.
+        cb_max_cooldown_s: Upper bound for the doubled cooldown.
+    """
+
+    def __init__(
+        self,
+        serial_number=None,
+        timeout_ms=3000,
+        cb_max_failures: int = 0,
+        cb_cooldown_s: float = 30.0,
+        cb_max_cooldown_s: float = 300.0,
+    ):
         _vid = 0x0483
         _pid = 0xF123
 
@@ -28,33 +63,86 @@ class Usb:
             # rather than ignoring it as a match condition.
             self._device = usb.core.find(idVendor=_vid, idProduct=_pid)
         self._timeout_ms = timeout_ms
+        self._cb_max_failures = cb_max_failures
+        self._cb_cooldown_s = cb_cooldown_s
+        self._cb_max_cooldown_s = cb_max_cooldown_s
+        self._cb_failures = 0
+        self._cb_open_until = 0.0
         if self._device is None:
             raise DeviceNotFound
+
+        # Keep every transfer a whole number of max-size packets: if a transfer ends mid-packet and the
+        # device sends a full packet there, libusb reports an overflow instead of the data
+        max_packet = self._in_max_packet_size()
+        self._rx_buf = array.array('B', bytes(-(-_RX_BUF_SIZE // max_packet) * max_packet))
+
+        # Reset the IN endpoint, then drain whatever a previous session left behind. Only the final
+        # read has to time out, so keep that timeout short: it is paid on every connect.
+        try:
+            self._device.clear_halt(0x81)
+        except usb.core.USBError:
+            pass
         while True:
             try:
-                self._device.read(0x81, 256, timeout=100)
+                self._device.read(0x81, self._rx_buf, timeout=_DRAIN_TIMEOUT_MS)
             except usb.core.USBTimeoutError:
                 break
 
+    def _in_max_packet_size(self) -> int:
+        try:
+            intf = self._device[0][(0, 0)]
+            ep = usb.util.find_descriptor(intf, bEndpointAddress=0x81)
+        except (usb.core.USBError, IndexError, KeyError):
+            ep = None
+        return ep.wMaxPacketSize if ep is not None else 64
+
     def execute(self, request: bytes) -> BytesBuffer:
+        # Circuit breaker (off unless cb_max_failures is set): a detached or hung device costs up to 3 read
+        # timeouts per command, so after repeated failures fail fast for a cooldown. Once it expires a single
+        # command probes the device, success closes the breaker and another failure reopens it with a doubled
+        # cooldown.
+        if not self._cb_max_failures:
+            return self._execute(request)
+        now = time.monotonic()
+        if now < self._cb_open_until:
+            raise MultipleUSBReadFailure(
+                f'USB circuit open for {self._cb_open_until - now:.1f}s after {self._cb_failures} failed commands'
+            )
+        try:
+            response = self._execute(request)
+        except (MultipleUSBReadFailure, usb.core.USBError):
+            self._cb_failures += 1
+            if self._cb_failures >= self._cb_max_failures:
+                cooldown = min(self._cb_cooldown_s * 2 ** (self._cb_failures - self._cb_max_failures), self._cb_max_cooldown_s)
+                self._cb_open_until = time.monotonic() + cooldown
+            raise
+        self._cb_failures = 0
+        return response
+
+    def _execute(self, request: bytes) -> BytesBuffer:
         self._device.write(0x1, request)
 
+        # Transfers land in the reusable receive buffer; pyusb fills an array in place and
+        # returns the byte count instead of allocating a new array for every read
+        rx_buf = self._rx_buf
+        rx_view = memoryview(rx_buf)
         trials = 0
         max_trials = 3
         while trials < max_trials:  # repeat until non-zero lenght data received
-            data = self._device.read(0x81, 256, timeout=self._timeout_ms).tobytes()
-            if len(data) != 0:
+            n = self._device.read(0x81, rx_buf, timeout=self._timeout_ms)
+            if n != 0:
                 break
             else:
                 trials += 1
         if trials >= max_trials:
             raise MultipleUSBReadFailure(str(trials) + ' USB Read Failures in sequence')
 
-        response_length = struct.unpack_from('<I', data)[0]
-        data = data[4:]
+        response_length = _LEN_HEADER.unpack_from(rx_buf)[0]
+        # A fresh payload per response: the returned BytesBuffer keeps a view on it
+        data = bytearray(rx_view[4:n])
 
         while len(data) < response_length:
-            r = self._device.read(0x81, response_length - len(data)).tobytes()
-            data += r
+            n = self._device.read(0x81, rx_buf)
+            data += rx_view[:n]
 
         return BytesBuffer(data)
@@ -8,44 +8,48 @@ Home Assistant modules.
 
 import sys
 import os
+import contextlib
+import io
 import json
+import importlib
+import importlib.util
+from pathlib import Path
 
 # Add the custom_components directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
 
+# Embedded library modules and the names each one must provide
+EMBEDDED_MODULES = [
+    ("custom_components.radiacode.radiacode_lib", ["RadiaCode"], "RadiaCode class"),
+    ("custom_components.radiacode.radiacode_lib.types", [
+        "RealTimeData", "RareData", "Spectrum", "AlarmLimits", "DisplayDirection",
+        "DoseRateDB", "Event", "RawData", "COMMAND", "CTRL", "VS", "VSFR",
+    ], "All types"),
+    ("custom_components.radiacode.radiacode_lib.bytes_buffer", ["BytesBuffer"], "BytesBuffer"),
+    ("custom_components.radiacode.radiacode_lib.transports.usb", ["Usb"], "USB transport"),
+    ("custom_components.radiacode.radiacode_lib.transports.bluetooth", ["Bluetooth"], "Bluetooth transport"),
+    ("custom_components.radiacode.radiacode_lib.decoders.databuf", ["decode_VS_DATA_BUF"], "Data buffer decoder"),
+    ("custom_components.radiacode.radiacode_lib.decoders.spectrum", ["decode_RC_VS_SPECTRUM"], "Spectrum decoder"),
+]
+
 def test_embedded_library_imports():
     """Test that all embedded library modules can be imported."""
     print("🔧 Testing embedded Radiacode library imports...")
     
     try:
-        # Test main library import
-        from custom_components.radiacode.radiacode_lib import RadiaCode
-        print("   ✅ RadiaCode class imported")
-        
-        # Test types import
-        from custom_components.radiacode.radiacode_lib.types import (
-            RealTimeData, RareData, Spectrum, AlarmLimits, DisplayDirection,
-            DoseRateDB, Event, RawData, COMMAND, CTRL, VS, VSFR
-        )
-        print("   ✅ All types imported")
-        
-        # Test bytes buffer
-        from custom_components.radiacode.radiacode_lib.bytes_buffer import BytesBuffer
-        print("   ✅ BytesBuffer imported")
-        
-        # Test transports
-        from custom_components.radiacode.radiacode_lib.transports.usb import Usb
-        print("   ✅ USB transport imported")
-        
-        from custom_components.radiacode.radiacode_lib.transports.bluetooth import Bluetooth
-        print("   ✅ Bluetooth transport imported")
-        
-        # Test decoders
-        from custom_components.radiacode.radiacode_lib.decoders.databuf import decode_VS_DATA_BUF
-        print("   ✅ Data buffer decoder imported")
+        # Locate every module first, so a missing one fails before any transport gets loaded
+        missing = [name for name, _, _ in EMBEDDED_MODULES if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ Embedded library modules not found: {missing}")
+            return False
         
-        from custom_components.radiacode.radiacode_lib.decoders.spectrum import decode_RC_VS_SPECTRUM
-        print("   ✅ Spectrum decoder imported")
+        for name, attrs, label in EMBEDDED_MODULES:
+            module = importlib.import_module(name)
+            missing_attrs = [attr for attr in attrs if not hasattr(module, attr)]
+            if missing_attrs:
+                print(f"❌ {name} is missing: {missing_attrs}")
+                return False
+            print(f"   ✅ {label} imported")
         
         print("✅ All embedded library imports successful!")
         return True
@@ -138,10 +142,11 @@ def test_radiacode_class_structure():
             'set_alarm_limits'
         ]
         
-        for method_name in expected_methods:
-            if not hasattr(RadiaCode, method_name):
-                print(f"   ❌ Missing method: {method_name}")
-                return False
+        members = set(dir(RadiaCode))
+        missing = [method_name for method_name in expected_methods if method_name not in members]
+        if missing:
+            print(f"   ❌ Missing methods: {missing}")
+            return False
         
         print("   ✅ RadiaCode class has all expected methods")
         return True
@@ -155,13 +160,12 @@ def test_manifest_requirements():
     print("\n📋 Testing manifest requirements...")
     
     try:
-        with open('custom_components/radiacode/manifest.json', 'r') as f:
-            manifest = json.load(f)
+        manifest = json.loads(Path('custom_components/radiacode/manifest.json').read_bytes())
         
         requirements = manifest.get('requirements', [])
         
         # Check that it doesn't include the external radiacode library
-        if 'radiacode' in str(requirements):
+        if any('radiacode' in req for req in requirements):
             print("   ❌ Manifest still references external radiacode library")
             return False
         
@@ -237,13 +241,16 @@ def main():
     
     results = []
     for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"   ❌ Test failed with exception: {e}")
-            results.append((test_name, False))
+        # Collect the test's output and write it in one go instead of a write per check
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            print(f"\n{test_name}:")
+            try:
+                result = test_func()
+            except Exception as e:
+                print(f"   ❌ Test failed with exception: {e}")
+                result = False
+        sys.stdout.write(output.getvalue())
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "=" * 60)
@@ -252,11 +259,13 @@ def main():
     passed = 0
     total = len(results)
     
+    lines = []
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"   {test_name}: {status}")
+        lines.append(f"   {test_name}: {status}\n")
         if result:
             passed += 1
+    sys.stdout.write(''.join(lines))
     
     print(f"\nOverall: {passed}/{total} tests passed")
     
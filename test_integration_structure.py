@@ -8,15 +8,59 @@ without requiring the actual radiacode library or device.
 
 import sys
 import os
+import contextlib
+import io
+import importlib
 import json
+import re
+from pathlib import Path
 
 # Add the custom_components directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
 
+# Names the tests look for, kept in report order
+REQUIRED_MANIFEST_FIELDS = ('domain', 'name', 'documentation', 'requirements', 'version', 'config_flow')
+REQUIRED_SERVICES = (
+    'radiacode_reset_dose',
+    'radiacode_reset_spectrum',
+    'radiacode_set_display_brightness',
+    'radiacode_get_spectrum',
+    'radiacode_get_energy_calibration',
+    'radiacode_set_energy_calibration',
+)
+REQUIRED_COORDINATOR_METHODS = (
+    'async_connect',
+    'async_shutdown',
+    'async_set_device_power',
+    'async_set_sound',
+    'async_set_vibration',
+    'async_set_display_brightness',
+    'async_reset_dose',
+    'async_reset_spectrum',
+    'async_get_spectrum',
+    'async_get_energy_calibration',
+    'async_set_energy_calibration',
+)
+PACKAGE = 'custom_components.radiacode'
+# Integration submodules, the names each one must provide and how the test reports it
+INTEGRATION_MODULES = (
+    ('const', ('DOMAIN', 'PLATFORMS'), 'Constants imported'),
+    ('coordinator', ('RadiacodeCoordinator',), 'Coordinator imported'),
+    ('config_flow', ('RadiacodeConfigFlow',), 'Config flow imported'),
+    ('sensor', ('async_setup_entry',), 'Sensor module imported'),
+    ('binary_sensor', ('async_setup_entry',), 'Binary sensor module imported'),
+    ('switch', ('async_setup_entry',), 'Switch module imported'),
+    ('services', ('async_setup_services',), 'Services module imported'),
+)
+
+_SERVICES_PATTERN = re.compile(b'|'.join(re.escape(service.encode()) for service in REQUIRED_SERVICES))
+
 def test_file_structure():
     """Test that all required files exist."""
     print("📁 Testing file structure...")
     
+    # manifest.json, services.yaml and translations/en.json are left to the tests
+    # that open them, a missing file fails those tests without a separate stat()
     required_files = [
         'custom_components/radiacode/__init__.py',
         'custom_components/radiacode/const.py',
@@ -26,10 +70,7 @@ def test_file_structure():
         'custom_components/radiacode/binary_sensor.py',
         'custom_components/radiacode/switch.py',
         'custom_components/radiacode/services.py',
-        'custom_components/radiacode/services.yaml',
-        'custom_components/radiacode/manifest.json',
         'custom_components/radiacode/README.md',
-        'custom_components/radiacode/translations/en.json',
     ]
     
     missing_files = []
@@ -51,13 +92,11 @@ def test_manifest():
     print("\n📋 Testing manifest file...")
     
     try:
-        with open('custom_components/radiacode/manifest.json', 'r') as f:
-            manifest = json.load(f)
+        manifest = json.loads(Path('custom_components/radiacode/manifest.json').read_bytes())
         
-        required_fields = ['domain', 'name', 'documentation', 'requirements', 'version', 'config_flow']
         missing_fields = []
         
-        for field in required_fields:
+        for field in REQUIRED_MANIFEST_FIELDS:
             if field not in manifest:
                 missing_fields.append(field)
             else:
@@ -75,6 +114,9 @@ def test_manifest():
         print("✅ Manifest file is valid")
         return True
         
+    except FileNotFoundError as e:
+        print(f"❌ Manifest file not found: {e}")
+        return False
     except Exception as e:
         print(f"❌ Failed to validate manifest: {e}")
         return False
@@ -84,22 +126,14 @@ def test_services_yaml():
     print("\n🔧 Testing services.yaml file...")
     
     try:
-        with open('custom_components/radiacode/services.yaml', 'r') as f:
-            content = f.read()
+        content = Path('custom_components/radiacode/services.yaml').read_bytes()
         
-        # Check for required services
-        required_services = [
-            'radiacode_reset_dose',
-            'radiacode_reset_spectrum',
-            'radiacode_set_display_brightness',
-            'radiacode_get_spectrum',
-            'radiacode_get_energy_calibration',
-            'radiacode_set_energy_calibration',
-        ]
+        # Check for required services, one pass over the file finds every service name
+        found = set(_SERVICES_PATTERN.findall(content))
         
         missing_services = []
-        for service in required_services:
-            if service in content:
+        for service in REQUIRED_SERVICES:
+            if service.encode() in found:
                 print(f"   ✅ {service}")
             else:
                 missing_services.append(service)
@@ -111,6 +145,9 @@ def test_services_yaml():
         print("✅ Services.yaml file is valid")
         return True
         
+    except FileNotFoundError as e:
+        print(f"❌ Services.yaml file not found: {e}")
+        return False
     except Exception as e:
         print(f"❌ Failed to validate services.yaml: {e}")
         return False
@@ -120,8 +157,7 @@ def test_translations():
     print("\n🌐 Testing translations file...")
     
     try:
-        with open('custom_components/radiacode/translations/en.json', 'r') as f:
-            translations = json.load(f)
+        translations = json.loads(Path('custom_components/radiacode/translations/en.json').read_bytes())
         
         # Check for required sections
         required_sections = ['config', 'entity', 'services']
@@ -140,6 +176,9 @@ def test_translations():
         print("✅ Translations file is valid")
         return True
         
+    except FileNotFoundError as e:
+        print(f"❌ Translations file not found: {e}")
+        return False
     except Exception as e:
         print(f"❌ Failed to validate translations: {e}")
         return False
@@ -149,27 +188,15 @@ def test_python_imports():
     print("\n🐍 Testing Python imports...")
     
     try:
-        # Test basic imports
-        from custom_components.radiacode.const import DOMAIN, PLATFORMS
-        print("   ✅ Constants imported")
-        
-        from custom_components.radiacode.coordinator import RadiacodeCoordinator
-        print("   ✅ Coordinator imported")
-        
-        from custom_components.radiacode.config_flow import RadiacodeConfigFlow
-        print("   ✅ Config flow imported")
-        
-        from custom_components.radiacode.sensor import async_setup_entry as sensor_setup
-        print("   ✅ Sensor module imported")
-        
-        from custom_components.radiacode.binary_sensor import async_setup_entry as binary_sensor_setup
-        print("   ✅ Binary sensor module imported")
-        
-        from custom_components.radiacode.switch import async_setup_entry as switch_setup
-        print("   ✅ Switch module imported")
-        
-        from custom_components.radiacode.services import async_setup_services
-        print("   ✅ Services module imported")
+        # Import the package once, each submodule import after that starts from sys.modules
+        package = importlib.import_module(PACKAGE)
+        for module, attrs, label in INTEGRATION_MODULES:
+            submodule = importlib.import_module(f'{package.__name__}.{module}')
+            missing_attrs = [attr for attr in attrs if not hasattr(submodule, attr)]
+            if missing_attrs:
+                print(f"❌ Failed to import modules: {submodule.__name__} is missing {missing_attrs}")
+                return False
+            print(f"   ✅ {label}")
         
         print("✅ All Python modules imported successfully")
         return True
@@ -191,26 +218,13 @@ def test_coordinator_structure():
                 self.data = {}
         
         hass = MockHass()
-        coordinator = RadiacodeCoordinator(hass, None, None, "Test Device")
+        coordinator = RadiacodeCoordinator(hass, None, None, "Test Device", "test_entry")
         
         # Check that required methods exist
-        required_methods = [
-            'async_connect',
-            'async_shutdown',
-            'async_set_device_power',
-            'async_set_sound',
-            'async_set_vibration',
-            'async_set_display_brightness',
-            'async_reset_dose',
-            'async_reset_spectrum',
-            'async_get_spectrum',
-            'async_get_energy_calibration',
-            'async_set_energy_calibration',
-        ]
-        
+        members = set(dir(coordinator))
         missing_methods = []
-        for method in required_methods:
-            if hasattr(coordinator, method):
+        for method in REQUIRED_COORDINATOR_METHODS:
+            if method in members:
                 print(f"   ✅ {method}")
             else:
                 missing_methods.append(method)
@@ -242,13 +256,16 @@ def main():
     
     results = []
     for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"   ❌ Test failed with exception: {e}")
-            results.append((test_name, False))
+        # Collect the test's output and write it in one go instead of a write per check
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            print(f"\n{test_name}:")
+            try:
+                result = test_func()
+            except Exception as e:
+                print(f"   ❌ Test failed with exception: {e}")
+                result = False
+        sys.stdout.write(output.getvalue())
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "=" * 60)
@@ -257,11 +274,13 @@ def main():
     passed = 0
     total = len(results)
     
+    lines = []
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"   {test_name}: {status}")
+        lines.append(f"   {test_name}: {status}\n")
         if result:
             passed += 1
+    sys.stdout.write(''.join(lines))
     
     print(f"\nOverall: {passed}/{total} tests passed")
     
@@ -9,6 +9,9 @@ without requiring a full Home Assistant installation.
 import asyncio
 import sys
 import os
+from collections import Counter
+import json
+from pathlib import Path
 
 # Add the custom_components directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components'))
@@ -45,14 +48,9 @@ async def test_radiacode_connection():
         
         # Get real-time data
         databuf = device.data_buf()
-        real_time_count = 0
-        rare_count = 0
-        
-        for record in databuf:
-            if hasattr(record, 'count_rate'):  # RealTimeData
-                real_time_count += 1
-            elif hasattr(record, 'temperature'):  # RareData
-                rare_count += 1
+        record_counts = Counter(type(record).__name__ for record in databuf)
+        real_time_count = record_counts['RealTimeData']
+        rare_count = record_counts['RareData']
         
         print(f"   Real-time data records: {real_time_count}")
         print(f"   Rare data records: {rare_count}")
@@ -107,7 +105,7 @@ async def test_integration_components():
                 self.data = {}
         
         hass = MockHass()
-        coordinator = RadiacodeCoordinator(hass, None, None, "Test Device")
+        coordinator = RadiacodeCoordinator(hass, None, None, "Test Device", "test_entry")
         print("✅ Coordinator created successfully")
         
         print("✅ All integration components imported successfully!")
@@ -117,14 +115,16 @@ async def test_integration_components():
         print(f"❌ Failed to import integration components: {e}")
         return False
 
-def test_manifest():
+async def _read_json(path):
+    """Read and parse a JSON file without blocking the event loop."""
+    return json.loads(await asyncio.to_thread(Path(path).read_bytes))
+
+async def test_manifest():
     """Test the manifest file."""
     print("\n📋 Testing manifest file...")
     
     try:
-        import json
-        with open('custom_components/radiacode/manifest.json', 'r') as f:
-            manifest = json.load(f)
+        manifest = await _read_json('custom_components/radiacode/manifest.json')
         
         required_fields = ['domain', 'name', 'documentation', 'requirements', 'version', 'config_flow']
         for field in required_fields:
@@ -145,7 +145,7 @@ async def main():
     print("=" * 50)
     
     # Test manifest
-    manifest_ok = test_manifest()
+    manifest_ok = await test_manifest()
     
     # Test integration components
     components_ok = await test_integration_components()
@@ -8,7 +8,10 @@ without any Home Assistant dependencies.
 
 import sys
 import os
+import contextlib
+import io
 import json
+from pathlib import Path
 
 # Add the radiacode_lib directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components', 'radiacode'))
@@ -122,6 +125,14 @@ def test_types_and_enums():
         print(f"❌ Failed to test types and enums: {e}")
         return False
 
+EXPECTED_RADIACODE_METHODS = frozenset({
+    'data_buf', 'spectrum', 'spectrum_accum',
+    'dose_reset', 'spectrum_reset', 'energy_calib',
+    'set_energy_calib', 'set_device_on', 'set_sound_on',
+    'set_vibro_on', 'set_display_brightness', 'get_alarm_limits',
+    'set_alarm_limits',
+})
+
 def test_radiacode_class_structure():
     """Test that the RadiaCode class has the expected methods."""
     print("\n🔧 Testing RadiaCode class structure...")
@@ -130,18 +141,10 @@ def test_radiacode_class_structure():
         from radiacode_lib import RadiaCode
         
         # Check that the class has the expected methods
-        expected_methods = [
-            'data_buf', 'spectrum', 'spectrum_accum',
-            'dose_reset', 'spectrum_reset', 'energy_calib',
-            'set_energy_calib', 'set_device_on', 'set_sound_on',
-            'set_vibro_on', 'set_display_brightness', 'get_alarm_limits',
-            'set_alarm_limits'
-        ]
-        
-        for method_name in expected_methods:
-            if not hasattr(RadiaCode, method_name):
-                print(f"   ❌ Missing method: {method_name}")
-                return False
+        missing_methods = EXPECTED_RADIACODE_METHODS - set(dir(RadiaCode))
+        if missing_methods:
+            print(f"   ❌ Missing methods: {sorted(missing_methods)}")
+            return False
         
         print("   ✅ RadiaCode class has all expected methods")
         return True
@@ -186,22 +189,25 @@ def test_manifest_self_contained():
     print("\n📋 Testing manifest for self-contained requirements...")
     
     try:
-        with open('custom_components/radiacode/manifest.json', 'r') as f:
-            manifest = json.load(f)
+        manifest = json.loads(Path('custom_components/radiacode/manifest.json').read_bytes())
+        
+        requirements = manifest.get('requirements', [])
         
         # Check that requirements don't include radiacode library
-        if 'radiacode' in str(manifest.get('requirements', [])):
+        if any('radiacode' in req for req in requirements):
             print("   ❌ Manifest still references external radiacode library")
             return False
         
         # Check that it includes the basic dependencies
-        requirements = manifest.get('requirements', [])
-        if 'usb' not in str(requirements):
+        if not any('usb' in req for req in requirements):
             print("   ⚠️  USB dependency not explicitly listed")
         
         print("   ✅ Manifest correctly reflects self-contained nature")
         return True
         
+    except FileNotFoundError as e:
+        print(f"❌ Manifest file not found: {e}")
+        return False
     except Exception as e:
         print(f"❌ Failed to validate manifest: {e}")
         return False
@@ -222,13 +228,16 @@ def main():
     
     results = []
     for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"   ❌ Test failed with exception: {e}")
-            results.append((test_name, False))
+        # Collect the test's output and write it in one go instead of a write per check
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            print(f"\n{test_name}:")
+            try:
+                result = test_func()
+            except Exception as e:
+                print(f"   ❌ Test failed with exception: {e}")
+                result = False
+        sys.stdout.write(output.getvalue())
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "=" * 65)
@@ -237,11 +246,13 @@ def main():
     passed = 0
     total = len(results)
     
+    lines = []
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"   {test_name}: {status}")
+        lines.append(f"   {test_name}: {status}\n")
         if result:
             passed += 1
+    sys.stdout.write(''.join(lines))
     
     print(f"\nOverall: {passed}/{total} tests passed")
     
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Test script for the USB transport
+
+This script drives radiacode.transports.usb against a stubbed usb.core device, so it
+runs without pyusb or a connected RadiaCode.
+"""
+
+import sys
+import os
+import array
+import contextlib
+import io
+import struct
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+class _USBError(Exception):
+    pass
+
+
+class _USBTimeoutError(_USBError):
+    pass
+
+
+class FakeDevice:
+    """Answers every write with the queued response, or with empty reads when dead."""
+
+    def __init__(self, response=b'', stale=b''):
+        self.response = response
+        self.pending = stale
+        self.dead = False
+        self.writes = 0
+
+    def __getitem__(self, index):
+        raise IndexError(index)
+
+    def clear_halt(self, endpoint):
+        pass
+
+    def write(self, endpoint, data):
+        self.writes += 1
+        self.pending = b'' if self.dead else self.response
+
+    def read(self, endpoint, buffer, timeout=None):
+        if not self.pending:
+            if timeout == usb_transport._DRAIN_TIMEOUT_MS:
+                raise _USBTimeoutError('timeout')
+            return 0
+        chunk, self.pending = self.pending[: len(buffer)], self.pending[len(buffer) :]
+        buffer[: len(chunk)] = array.array('B', chunk)
+        return len(chunk)
+
+
+def _install_usb_stub(device):
+    """Replace the usb package with a stub whose find() returns device."""
+    usb = types.ModuleType('usb')
+    usb.core = types.ModuleType('usb.core')
+    usb.core.USBError = _USBError
+    usb.core.USBTimeoutError = _USBTimeoutError
+    usb.core.find = lambda **kwargs: device
+    usb.util = types.ModuleType('usb.util')
+    usb.util.find_descriptor = lambda *args, **kwargs: None
+    sys.modules.update({'usb': usb, 'usb.core': usb.core, 'usb.util': usb.util})
+
+
+_install_usb_stub(None)
+from radiacode.transports import usb as usb_transport  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _open(device, **kwargs):
+    usb_transport.usb.core.find = lambda **_: device
+    return usb_transport.Usb(**kwargs)
+
+
+def _response(payload):
+    return struct.pack('<I', len(payload)) + payload
+
+
+def test_connect():
+    """Test that connecting drains stale data and a missing device is reported."""
+    print("🔧 Testing USB connect...")
+
+    try:
+        usb_transport.usb.core.find = lambda **_: None
+        usb_transport.Usb()
+        print("   ❌ Missing device not reported")
+        return False
+    except usb_transport.DeviceNotFound:
+        print("   ✅ Missing device raises DeviceNotFound")
+
+    device = FakeDevice(stale=b'\xff' * 100)
+    _open(device)
+    if device.pending:
+        print("   ❌ Stale data left on the endpoint")
+        return False
+    print("   ✅ Stale data drained on connect")
+    return True
+
+
+def test_execute():
+    """Test that responses spanning several transfers are reassembled."""
+    print("🔧 Testing USB execute...")
+
+    for size in (0, 5, 4100, 9000):
+        payload = bytes(i % 251 for i in range(size))
+        device = FakeDevice(_response(payload))
+        if _open(device).execute(b'x').data() != payload:
+            print(f"   ❌ {size} byte response corrupted")
+            return False
+    print("   ✅ Responses reassembled")
+    return True
+
+
+def test_circuit_breaker_disabled_by_default():
+    """Test that without cb_max_failures every command reaches the device."""
+    print("🔧 Testing circuit breaker default...")
+
+    device = FakeDevice()
+    device.dead = True
+    usb = _open(device)
+    for _ in range(5):
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+    if device.writes != 5:
+        print(f"   ❌ {device.writes} of 5 commands reached the device")
+        return False
+    print("   ✅ Every command reaches the device")
+    if usb._cb_failures:
+        print(f"   ❌ Disabled breaker counted {usb._cb_failures} failures")
+        return False
+    print("   ✅ Disabled breaker keeps no failure count")
+    return True
+
+
+def test_circuit_breaker():
+    """Test that the breaker opens, probes after the cooldown and closes again."""
+    print("🔧 Testing circuit breaker...")
+
+    clock = FakeClock()
+    usb_transport.time = clock
+    try:
+        device = FakeDevice(_response(b'ok'))
+        device.dead = True
+        usb = _open(device, cb_max_failures=2, cb_cooldown_s=30.0, cb_max_cooldown_s=45.0)
+
+        for _ in range(3):
+            with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+                usb.execute(b'x')
+        if device.writes != 2:
+            print(f"   ❌ Breaker did not open: {device.writes} writes")
+            return False
+        print("   ✅ Opens after cb_max_failures and fails fast")
+
+        clock.now += 31
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+        if device.writes != 3:
+            print(f"   ❌ Expected one probe after the cooldown: {device.writes} writes")
+            return False
+        print("   ✅ A single command probes after the cooldown")
+
+        # The failed probe doubled the cooldown, capped at cb_max_cooldown_s
+        clock.now += 44
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+        if device.writes != 3:
+            print("   ❌ Cooldown was not extended after a failed probe")
+            return False
+        clock.now += 2
+        device.dead = False
+        if usb.execute(b'x').data() != b'ok':
+            print("   ❌ Successful probe returned the wrong response")
+            return False
+
+        device.dead = True
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+        with contextlib.suppress(usb_transport.MultipleUSBReadFailure):
+            usb.execute(b'x')
+        if device.writes != 6:
+            print(f"   ❌ Breaker did not close after a successful probe: {device.writes} writes")
+            return False
+        print("   ✅ A successful probe closes the breaker")
+        return True
+    finally:
+        usb_transport.time = __import__('time')
+
+
+def main():
+    """Run all tests."""
+    print("🧪 USB Transport Test")
+    print("=" * 60)
+
+    tests = [
+        ("Connect", test_connect),
+        ("Execute", test_execute),
+        ("Circuit Breaker Default", test_circuit_breaker_disabled_by_default),
+        ("Circuit Breaker", test_circuit_breaker),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        # Collect the test's output and write it in one go instead of a write per check
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            print(f"\n{test_name}:")
+            try:
+                result = test_func()
+            except Exception as e:
+                print(f"   ❌ Test failed with exception: {e}")
+                result = False
+        sys.stdout.write(output.getvalue())
+        results.append((test_name, result))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("📊 Test Results:")
+
+    passed = 0
+    total = len(results)
+
+    lines = []
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        lines.append(f"   {test_name}: {status}\n")
+        if result:
+            passed += 1
+    sys.stdout.write(''.join(lines))
+
+    print(f"\nOverall: {passed}/{total} tests passed")
+
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)